@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 import os
 import json
+import orjson
 import time
 import random
 import logging
 import argparse
 import requests
 import re
+import threading
 from typing import Dict, List, Any, Optional, Set, Union, Tuple
 from pathlib import Path
+from collections import OrderedDict
 from tqdm import tqdm
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -28,9 +31,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger("etymology_generator")
 
+# Maximum number of (language, word) entries kept in the etymology memo
+ETYMOLOGY_CACHE_SIZE = 100_000
+
+# Seconds a memoized etymology stays fresh before it is fetched again
+ETYMOLOGY_CACHE_TTL = 24 * 60 * 60
+
+# Root languages considered consistent with each word language
+EXPECTED_LANGUAGE_PROGRESSION = {
+    "English": frozenset(["French", "Latin", "Greek", "Proto-Germanic", "Proto-Indo-European"]),
+    "French": frozenset(["Latin", "Greek", "Proto-Indo-European"]),
+    "German": frozenset(["Proto-Germanic", "Proto-Indo-European"]),
+    "Spanish": frozenset(["Latin", "Arabic", "Proto-Indo-European"]),
+    "Italian": frozenset(["Latin", "Proto-Indo-European"]),
+    "Latin": frozenset(["Proto-Indo-European"]),
+    "Greek": frozenset(["Proto-Indo-European"])
+}
+
+# One alternation per language, so a root language is checked against every expected name in a single scan
+EXPECTED_LANGUAGE_PATTERNS = {
+    language: re.compile("|".join(map(re.escape, names)))
+    for language, names in EXPECTED_LANGUAGE_PROGRESSION.items()
+}
+
 class EtymologyGenerator:
+    # Language mapping (name to ISO code), shared by all instances
+    LANG_CODES = {
+        "English": "en",
+        "French": "fr",
+        "German": "de",
+        "Spanish": "es",
+        "Italian": "it",
+        "Portuguese": "pt",
+        "Latin": "la",
+        "Greek": "el",
+        "Russian": "ru",
+        "Arabic": "ar",
+        "Chinese": "zh",
+        "Japanese": "ja",
+        "Korean": "ko"
+    }
+
     def __init__(self, max_words=None, languages=None, test_mode=False, sources=None, 
-                 geo_data=False, geo_mapping=None):
+                 geo_data=False, geo_mapping=None, threads=1, batch_size=10):
         """Initialize the etymology generator."""
         # Basic setup and logging configuration
         self.test_mode = test_mode
@@ -42,10 +85,13 @@ class EtymologyGenerator:
         # Configure output files and directories
         self.output_dir = self.setup_output_directory()
         self.cache_dir = self.setup_cache_directory()
-        
-        # Initialize language detection and NLP tools
-        self.initialize_language_detection()
-        
+
+        # LRU memo of successfully fetched etymologies keyed by (language, word), persisted across runs;
+        # each source set gets its own file, since a result depends on which sources were consulted
+        sources_key = "-".join(sorted(s.strip().lower() for s in self.sources))
+        self.etymology_cache_file = self.cache_dir / f"etymology_cache_{sources_key}.json"
+        self.etymology_cache = self.load_etymology_cache()
+
         # Initialize geo data mapping if enabled
         if self.geo_data:
             self.load_geo_mapping()
@@ -55,12 +101,19 @@ class EtymologyGenerator:
         self.connections_made = 0
         self.successful_words = 0
         self.failed_words = 0
+
+        # Guards the counters, results and etymology memo, since process_word runs on worker threads
+        self.lock = threading.Lock()
         
         # Languages to process
         self.languages = languages if languages else ["English", "French", "German"]
         
         # Maximum number of words to process
         self.max_words = max_words
+
+        # Worker threads and number of words handed to each process_batch call
+        self.threads = threads
+        self.batch_size = batch_size
         
         # For testing
         self.results = {}
@@ -68,6 +121,9 @@ class EtymologyGenerator:
         # Load supplementary data
         self.supplementary_data = self.load_supplementary_data()
 
+        # Etymological Wordnet relationships, filled in if that source initializes
+        self.etymwordnet_data = {}
+
         # Load additional data sources
         self.load_data_sources()
         
@@ -76,24 +132,58 @@ class EtymologyGenerator:
     def setup_output_directory(self):
         """Set up the output directory for storing etymology data."""
         output_dir = Path("./output")
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
         
     def setup_cache_directory(self):
         """Set up the cache directory for storing downloaded data."""
         cache_dir = Path("./cache")
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
         
-        # Create subdirectories for each data source
+        # Create subdirectories for each data source (and the cache directory with them)
+        cache_dir.mkdir(parents=True, exist_ok=True)
         for source in self.sources:
-            source_dir = cache_dir / source
-            if not os.path.exists(source_dir):
-                os.makedirs(source_dir)
+            (cache_dir / source).mkdir(parents=True, exist_ok=True)
         
         return cache_dir
 
+    def load_etymology_cache(self):
+        """Load the fresh entries of the persisted etymology memo from a previous run, if any."""
+        cache = OrderedDict()
+        if not os.path.exists(self.etymology_cache_file):
+            return cache
+
+        cutoff = time.time() - ETYMOLOGY_CACHE_TTL
+        try:
+            with open(self.etymology_cache_file, 'r', encoding='utf-8') as f:
+                for language, words in json.load(f).items():
+                    for word, entry in words.items():
+                        # Skip expired entries and ones without roots so they get fetched again
+                        if entry["fetched_at"] >= cutoff and entry["data"].get("roots"):
+                            cache[(language, word)] = (entry["fetched_at"], entry["data"])
+            self.logger.info(f"Loaded {len(cache)} cached etymologies")
+        except Exception as e:
+            self.logger.warning(f"Error loading etymology cache: {str(e)}")
+
+        return cache
+
+    def save_state(self):
+        """Persist the etymology memo so later runs can skip words already fetched."""
+        with self.lock:
+            entries = list(self.etymology_cache.items())
+        by_language = {}
+        for (language, word), (fetched_at, data) in entries:
+            by_language.setdefault(language, {})[word] = {"fetched_at": fetched_at, "data": data}
+
+        # Serialize in one shot and write it beside the cache file, then swap it in
+        # (as write_json_file does) so an interrupted save never truncates the memo
+        data = orjson.dumps(by_language)
+        tmp_file = self.etymology_cache_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+        os.replace(tmp_file, self.etymology_cache_file)
+
+        self.logger.info(f"Saved {len(entries)} cached etymologies")
+
     def load_data_sources(self):
         """Load and initialize configured data sources."""
         available_sources = {
@@ -363,8 +453,8 @@ class EtymologyGenerator:
             
             word_lower = word.lower()
             
-            if hasattr(self, 'etymwordnet_data') and lang_code in self.etymwordnet_data and word_lower in self.etymwordnet_data[lang_code]:
-                word_data = self.etymwordnet_data[lang_code][word_lower]
+            word_data = self.etymwordnet_data.get(lang_code, {}).get(word_lower)
+            if word_data is not None:
                 self.logger.info(f"Found {word} in etymwordnet data")
                 
                 # Process derived_from relationships to find roots
@@ -648,8 +738,8 @@ class EtymologyGenerator:
                     continue
             
             # Cache the results
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
                 
             return result
             
@@ -823,8 +913,8 @@ class EtymologyGenerator:
                         continue
             
             # Cache the results
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
                 
             return result
             
@@ -870,11 +960,11 @@ class EtymologyGenerator:
         """Fetch etymology data from all configured sources."""
         # Initialize the result structure
         result = {
-        "word": word,
-        "language": language,
-        "year": None,
-        "definition": "",
-        "roots": []
+            "word": word,
+            "language": language,
+            "year": None,
+            "definition": "",
+            "roots": []
         }
         
         # Check the data directory first
@@ -884,13 +974,13 @@ class EtymologyGenerator:
         
         # If data already exists and we're in a recovery situation, load it
         if word_file.exists():
-        try:
-            with open(word_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                self.logger.info(f"Found existing data for {word}")
-                return existing_data
-        except Exception as e:
-            self.logger.warning(f"Error loading existing data for {word}: {str(e)}")
+            try:
+                with open(word_file, 'r', encoding='utf-8') as f:
+                    existing_data = json.load(f)
+                    self.logger.info(f"Found existing data for {word}")
+                    return existing_data
+            except Exception as e:
+                self.logger.warning(f"Error loading existing data for {word}: {str(e)}")
         
         # Check our supplementary data for known etymologies
         if word.lower() in self.supplementary_data:
@@ -974,20 +1064,55 @@ class EtymologyGenerator:
         
         os.makedirs(first_letter_dir, exist_ok=True)
         
-        # Save the file
+        # Save the file, serialized up front so it goes out in one write
         word_file = first_letter_dir / f"{word}.json"
-        with open(word_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        word_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             
         self.logger.debug(f"Saved etymology data for {word} ({language})")
 
+    def write_json_file(self, file_path, data):
+        """Write data as JSON, replacing the file atomically so a crash never leaves it half-written."""
+        tmp_file = file_path.with_suffix(".json.tmp")
+        with open(tmp_file, "wb", buffering=1 << 20) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, file_path)
+
+    def memo_get(self, cache_key):
+        """Return a copy of a fresh memoized etymology, marking it recently used, or None."""
+        with self.lock:
+            entry = self.etymology_cache.get(cache_key)
+            if entry is None:
+                return None
+            fetched_at, data = entry
+            if time.time() - fetched_at > ETYMOLOGY_CACHE_TTL:
+                del self.etymology_cache[cache_key]
+                return None
+            self.etymology_cache.move_to_end(cache_key)
+            return dict(data)
+
+    def memo_put(self, cache_key, data):
+        """Memoize a copy of a fetched etymology, evicting the least recently used entry when full."""
+        # Failed or empty lookups aren't kept, so they are retried on this run and later ones
+        if not data.get("roots"):
+            return
+        with self.lock:
+            self.etymology_cache[cache_key] = (time.time(), dict(data))
+            self.etymology_cache.move_to_end(cache_key)
+            if len(self.etymology_cache) > ETYMOLOGY_CACHE_SIZE:
+                self.etymology_cache.popitem(last=False)
+
     def process_word(self, word, language="English"):
         """Process a word and store its etymology data."""
         self.logger.info(f"Processing test word: {word} ({language})")
         
-        # Fetch etymology data
-        etymology_data = self.fetch_etymology(word, language)
-        
+        # Fetch etymology data, reusing the memo for words already seen
+        cache_key = (language, word)
+        etymology_data = self.memo_get(cache_key)
+        if etymology_data is None:
+            etymology_data = self.fetch_etymology(word, language)
+            if etymology_data:
+                self.memo_put(cache_key, etymology_data)
+
         if etymology_data:
             # Calculate the quality score for the etymology data
             quality_score = self.evaluate_data_quality(etymology_data)
@@ -995,114 +1120,83 @@ class EtymologyGenerator:
             
             # Store the result
             key = f"{language}_{word}"
-            self.results[key] = etymology_data
+            with self.lock:
+                self.results[key] = etymology_data
             
-            # Save to output file if not in test mode
-            if not self.test_mode:
-                output_file = self.output_dir / f"{language}_{word}.json"
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(etymology_data, f, indent=2)
-            else:
-                # In test mode, save to test output directory if it exists
-                output_file = self.output_dir / f"{language}_{word}.json"
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(etymology_data, f, indent=2)
+            # Save to output file (the test output directory in test mode)
+            output_file = Path(self.output_dir) / f"{language}_{word}.json"
+            self.write_json_file(output_file, etymology_data)
+            if self.test_mode:
                 self.logger.info(f"Saved test output to {output_file}")
             
-            # Track progress
-            self.words_processed += 1
-            self.successful_words += 1
-            self.connections_made += len(etymology_data.get("roots", []))
+            roots = etymology_data.get("roots", [])
             
-            # Display etymology summary
-            self.logger.info(f"Etymology Summary for {word} ({language}), year: {etymology_data.get('year')}")
-            self.logger.info(f"Definition: {etymology_data.get('definition', '')[:50]}...")
+            # Track progress
+            with self.lock:
+                self.words_processed += 1
+                self.successful_words += 1
+                self.connections_made += len(roots)
             
-            roots = etymology_data.get("roots", [])
-            if roots:
-                self.logger.info(f"Root words ({len(roots)}):")
-                for i, root in enumerate(roots, 1):
-                    self.logger.info(f"  {i}. {root.get('word', '')} ({root.get('language', '')}), year: {root.get('year')}")
-            else:
-                self.logger.info("No root words found")
+            # Display etymology summary (debug only, so INFO runs skip building it), as one record per word
+            if self.logger.isEnabledFor(logging.DEBUG):
+                lines = ["Etymology Summary for %s (%s), year: %s, definition: %.50s, roots: %d" % (
+                    word, language, etymology_data.get('year'), etymology_data.get('definition', ''), len(roots))]
+                lines.extend("  %d. %s (%s), year: %s" % (i, root.get('word', ''), root.get('language', ''), root.get('year'))
+                             for i, root in enumerate(roots, 1))
+                self.logger.debug("\n".join(lines))
                 
-            self.logger.info(f"Successfully processed {word} with {len(roots)} connections")
+            self.logger.info("Successfully processed %s with %d connections", word, len(roots))
             
             return etymology_data
         else:
-            self.words_processed += 1
-            self.failed_words += 1
+            with self.lock:
+                self.words_processed += 1
+                self.failed_words += 1
             self.logger.warning(f"Failed to process {word}")
             return None
             
     def evaluate_data_quality(self, etymology_data):
         """Evaluate the quality of etymology data and return a score out of 100."""
-        # Initialize score
-        score = 0
         max_score = 100
+        roots = etymology_data.get('roots') or []
+        num_roots = len(roots)
+        definition = etymology_data.get('definition') or ''
         
-        # 1. Has roots (25 points)
-        if 'roots' in etymology_data and etymology_data['roots']:
-            score += 25
-            
-            # Bonus points for multiple roots (up to 10)
-            num_roots = len(etymology_data['roots'])
-            if num_roots > 1:
-                score += min(10, num_roots * 5)
-        
+        # 1. Has roots (25 points), bonus for multiple roots (up to 10)
         # 2. Has year (20 points)
-        if 'year' in etymology_data and etymology_data['year']:
-            score += 20
-        
         # 3. Has definition (20 points)
-        if 'definition' in etymology_data and etymology_data['definition'] and len(etymology_data['definition']) > 10:
-            score += 20
+        score = (25 * bool(roots)
+                 + min(10, num_roots * 5) * (num_roots > 1)
+                 + 20 * bool(etymology_data.get('year'))
+                 + 20 * (len(definition) > 10))
             
         # 4. Has geographical data (15 points)
         if self.geo_data:
             if 'geo_origin' in etymology_data:
                 score += 10
                 
-            # Check roots for geographical data
-            if 'roots' in etymology_data:
-                geo_roots = 0
-                for root in etymology_data['roots']:
-                    if 'geo_origin' in root:
-                        geo_roots += 1
-                
-                # Award points based on percentage of roots with geo data
-                if etymology_data['roots']:
-                    geo_pct = geo_roots / len(etymology_data['roots'])
-                    score += int(5 * geo_pct)
+            # Award points based on percentage of roots with geo data
+            if num_roots:
+                geo_roots = sum('geo_origin' in root for root in roots)
+                score += int(5 * geo_roots / num_roots)
                     
         # 5. Check consistency (10 points)
         consistent = True
         
-        # Language consistency
-        if 'roots' in etymology_data and etymology_data['roots']:
-            expected_language_progression = {
-                "English": ["French", "Latin", "Greek", "Proto-Germanic", "Proto-Indo-European"],
-                "French": ["Latin", "Greek", "Proto-Indo-European"],
-                "German": ["Proto-Germanic", "Proto-Indo-European"],
-                "Spanish": ["Latin", "Arabic", "Proto-Indo-European"],
-                "Italian": ["Latin", "Proto-Indo-European"],
-                "Latin": ["Proto-Indo-European"],
-                "Greek": ["Proto-Indo-European"]
-            }
+        # Language consistency: root languages must be reasonable for this language
+        language = etymology_data.get('language')
+        expected = EXPECTED_LANGUAGE_PROGRESSION.get(language)
+        if roots and expected:
+            root_langs = {root.get('language') for root in roots if root.get('language')}
             
-            language = etymology_data.get('language')
-            if language in expected_language_progression:
-                expected = expected_language_progression[language]
-                
-                # Check if root languages are reasonable for this language
-                for root in etymology_data['roots']:
-                    root_lang = root.get('language')
-                    if root_lang and not any(exp in root_lang for exp in expected):
-                        consistent = False
-                        break
+            # Exact names are cleared in one set difference; the rest must
+            # contain an expected name (e.g. "Ancient Greek" for "Greek")
+            unmatched = root_langs - expected
+            if unmatched:
+                search = EXPECTED_LANGUAGE_PATTERNS[language].search
+                consistent = all(search(lang) for lang in unmatched)
         
-        if consistent:
-            score += 10
+        score += 10 * consistent
             
         # Ensure score doesn't exceed max
         return min(score, max_score)
@@ -1114,13 +1208,12 @@ class EtymologyGenerator:
             for future in as_completed(futures):
                 word = futures[future]
                 try:
-                    success = future.result()
-                    # Update progress regardless of success
-                    self.stats["total_words_processed"] += 1
+                    future.result()
                 except Exception as e:
-                    logger.error(f"Exception processing {word}: {str(e)}")
-                    self.stats["failed_words"] += 1
-                    self.stats["total_words_processed"] += 1
+                    self.logger.error(f"Exception processing {word}: {str(e)}")
+                    with self.lock:
+                        self.failed_words += 1
+                        self.words_processed += 1
 
     def estimate_dataset_size(self, word_lists):
         """Estimate dataset size and processing time."""
@@ -1166,14 +1259,20 @@ class EtymologyGenerator:
             for language, words in word_lists.items():
                 self.logger.info(f"Processing {len(words)} {language} words")
                 
-                # Set up progress bar
-                with tqdm(total=len(words), desc=f"Processing {language} words") as pbar:
-                    for word in words:
-                        # Process individual word
-                        success = self.process_word(word, language)
+                # Set up progress bar, refreshed once per batch rather than per word
+                with tqdm(total=len(words), desc=f"Processing {language} words",
+                          mininterval=0.5, miniters=self.batch_size) as pbar:
+                    for start in range(0, len(words), self.batch_size):
+                        batch = words[start:start + self.batch_size]
+                        
+                        # Don't process past the word limit (a negative slice would drop words from the end instead)
+                        if self.max_words:
+                            batch = batch[:max(0, self.max_words - self.words_processed)]
+                        
+                        self.process_batch(batch, language)
                         
                         # Update progress
-                        pbar.update(1)
+                        pbar.update(len(batch))
                         
                         # Break if max words reached
                         if self.max_words and self.words_processed >= self.max_words:
@@ -1408,28 +1507,6 @@ class EtymologyGenerator:
             self.logger.error(f"Error loading supplementary data: {e}")
             return {}
 
-    def initialize_language_detection(self):
-        """Initialize language detection tools."""
-        # Language mapping (ISO code to name)
-        self.lang_codes = {
-            "English": "en",
-            "French": "fr",
-            "German": "de",
-            "Spanish": "es",
-            "Italian": "it",
-            "Portuguese": "pt",
-            "Latin": "la",
-            "Greek": "el",
-            "Russian": "ru",
-            "Arabic": "ar",
-            "Chinese": "zh",
-            "Japanese": "ja",
-            "Korean": "ko"
-        }
-        
-        # Initialize other NLP tools here if needed
-        self.logger.debug("Initialized language detection tools")
-
 def main():
     parser = argparse.ArgumentParser(description="Etymology Dataset Generator")
     parser.add_argument("--test", action="store_true", help="Run in test mode (no file writing)")
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 import os
 import sys
-import json
 import time
 import logging
 import argparse
+import gzip
+import shutil
 import multiprocessing
 from pathlib import Path
-from functools import partial
+from itertools import islice
+from collections import defaultdict
 from datetime import datetime
 
+import orjson
+
 # Add this file's directory to the path so we can import the tester module
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from test_etymology_simple import SimpleEtymologyTester
@@ -21,10 +25,169 @@ logging.basicConfig(
 )
 logger = logging.getLogger("etymology_generator")
 
+def write_bytes(path, payload):
+    """Write an already-serialized payload to path with a single os.write where possible."""
+    # Write beside the target and swap it in: an interrupted write never leaves a truncated file,
+    # and a name hardlinked by link_output gets a new inode instead of rewriting its siblings
+    tmp = f"{path}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+def write_output(path, payload, compress="none"):
+    """Write an output payload, gzip-compressed to path + ".gz" when compress is "gz"."""
+    if compress == "gz":
+        write_bytes(f"{path}.gz", gzip.compress(payload, compresslevel=3))
+    else:
+        write_bytes(path, payload)
+
+def link_output(src, dst, compress="none"):
+    """Give an already written output file a second name, copying it if hardlinks are unavailable."""
+    if compress == "gz":
+        src, dst = f"{src}.gz", f"{dst}.gz"
+    tmp = f"{dst}.tmp"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+# Directories this process has already created, so repeat batches skip the mkdir syscalls
+_CREATED_DIRS = set()
+
+def _ensure_dir(path):
+    """Create a directory once per process."""
+    if path not in _CREATED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+def _ndjson_payload(results):
+    """Serialize a word -> result mapping as one {"word": ..., "result": ...} record per line."""
+    return b"".join(orjson.dumps({"word": word, "result": result}) + b"\n"
+                    for word, result in results.items())
+
+# Pool worker's tester: inherited from the parent under fork, built by _init_worker otherwise
+_WORKER_TESTER = None
+
+def _init_worker():
+    """Build the SimpleEtymologyTester for a pool worker process."""
+    global _WORKER_TESTER
+    _WORKER_TESTER = SimpleEtymologyTester()
+
+def _init_forked_worker():
+    """Give a forked pool worker's inherited tester its own session, fetch threads and cache lock."""
+    # The parent may have used them before forking: its fetch threads don't exist in the child,
+    # and a lock or pooled connection could have been held mid-request at the fork
+    _WORKER_TESTER.init_fetch_state()
+
+# Kept at module level and free of generator state so pool tasks only carry
+# the batch and a few plain settings across the process boundary
+def _process_batch(tester, batch, batch_index, total_batches, language, use_sample_data,
+                   store_by_first_letter, output_dir, ndjson=False, compress="none"):
+    """Process a batch of words with the given tester and save the results."""
+    batch_size = len(batch)
+    
+    # Indentation only pays off for files people open directly, not compressed ones
+    json_option = orjson.OPT_INDENT_2 if compress == "none" else 0
+    batch_start_time = time.time()
+    
+    logger.info(f"Processing batch {batch_index + 1}/{total_batches} with {batch_size} words")
+    
+    results = {}
+    by_letter_results = defaultdict(dict)
+    connections = 0
+    quality_sum = 0.0
+    quality_sumsq = 0.0
+    sample_hits = 0
+    
+    # Sample data is only consulted when enabled; it is probed once per word
+    sample_data = tester.sample_data if use_sample_data else {}
+    
+    for word in batch:
+        # Process the word
+        result = sample_data.get(word.lower())
+        if result is not None:
+            logger.debug("Using sample data for %s", word)
+            sample_hits += 1
+        else:
+            result = tester.process_word(word, language)
+        
+        results[word] = result
+        
+        # Store by first letter if enabled
+        if store_by_first_letter and word:
+            first_letter = word[0].lower()
+            if first_letter.isalpha():
+                by_letter_results[first_letter][word] = result
+        
+        # Update statistics
+        quality = result.get("quality_score", 0)
+        quality_sum += quality
+        quality_sumsq += quality * quality
+        connections += len(result.get("roots", []))
+    
+    # Save batch results
+    if store_by_first_letter:
+        # Save each letter's results to its own directory
+        written = {}
+        for letter, letter_results in by_letter_results.items():
+            letter_dir = output_dir / letter
+            _ensure_dir(letter_dir)
+            
+            if ndjson:
+                # One line-delimited file per letter and batch instead of a file per word
+                letter_file = letter_dir / f"batch_{batch_index + 1}.ndjson"
+                write_output(letter_file, _ndjson_payload(letter_results), compress)
+            else:
+                for word, result in letter_results.items():
+                    word_file = letter_dir / f"{word}.json"
+                    # Words sharing one sample_data entry are serialized once and linked after that
+                    first_file = written.setdefault(id(result), word_file)
+                    if first_file == word_file:
+                        write_output(word_file, orjson.dumps(result, option=json_option), compress)
+                    else:
+                        link_output(first_file, word_file, compress)
+        
+        logger.info("Saved %d words in %d letter directories",
+                    sum(map(len, by_letter_results.values())), len(by_letter_results))
+    else:
+        # Save all batch results to a single file, one record per line
+        batch_file = output_dir / f"batch_{batch_index + 1}_of_{total_batches}.ndjson"
+        write_output(batch_file, _ndjson_payload(results), compress)
+    
+    batch_elapsed_time = time.time() - batch_start_time
+    batch_wps = batch_size / batch_elapsed_time if batch_elapsed_time > 0 else 0
+    
+    avg_quality = quality_sum / batch_size if batch_size > 0 else 0
+    avg_connections = connections / batch_size if batch_size > 0 else 0
+    
+    logger.info(f"Completed batch {batch_index + 1}/{total_batches} in {batch_elapsed_time:.2f}s")
+    if sample_hits:
+        logger.info("Batch %d: %d words from sample data", batch_index + 1, sample_hits)
+    logger.info(f"Batch stats: {batch_wps:.1f} words/s, Quality: {avg_quality:.1f}/100, Connections: {connections}")
+    
+    return {
+        "batch_index": batch_index,
+        "words_processed": batch_size,
+        "connections": connections,
+        "quality_sum": quality_sum,
+        "quality_sumsq": quality_sumsq
+    }
+
+def _process_batch_task(task):
+    """Run one pool task tuple through _process_batch with this worker's tester."""
+    return _process_batch(_WORKER_TESTER, *task)
+
 class EtymologyGenerator:
     """A system to generate etymology data for a list of words."""
     
-    def __init__(self, output_dir="output", use_sample_data=False, store_by_first_letter=False):
+    def __init__(self, output_dir="output", use_sample_data=False, store_by_first_letter=False,
+                 ndjson=False, compress="none"):
         """Initialize the generator with output directory."""
         # Set up paths
         self.output_dir = Path(output_dir)
@@ -43,13 +206,21 @@ class EtymologyGenerator:
             "processed_words": 0,
             "start_time": time.time(),
             "end_time": None,
-            "quality_scores": [],
+            "quality_count": 0,
+            "quality_sum": 0.0,
+            "quality_sumsq": 0.0,
             "connections": 0
         }
         
         # Flags
         self.use_sample_data = use_sample_data
         self.store_by_first_letter = store_by_first_letter
+        self.ndjson = ndjson
+        self.compress = compress
+        
+        # Throttle progress checkpoints to one write every few seconds
+        self.progress_save_interval = 5.0
+        self.last_progress_save = 0
         
         # Load progress if it exists
         self.progress = self.load_progress()
@@ -58,16 +229,25 @@ class EtymologyGenerator:
         """Load progress from a progress file if it exists."""
         if os.path.exists(self.progress_file):
             try:
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    progress = json.load(f)
+                with open(self.progress_file, 'rb') as f:
+                    progress = orjson.loads(f.read())
                     logger.info(f"Loaded progress: {progress['processed_words']} of {progress['total_words']} words processed")
                     
+                    # Older checkpoints stored every score; fold them into running totals
+                    old_scores = progress.pop("quality_scores", None)
+                    if old_scores is not None:
+                        progress["quality_count"] = len(old_scores)
+                        progress["quality_sum"] = float(sum(old_scores))
+                        progress["quality_sumsq"] = float(sum(q * q for q in old_scores))
+                    
                     # Update statistics
                     self.stats.update({
                         "total_words": progress.get("total_words", 0),
                         "processed_words": progress.get("processed_words", 0),
                         "start_time": progress.get("start_time", time.time()),
-                        "quality_scores": progress.get("quality_scores", []),
+                        "quality_count": progress.get("quality_count", 0),
+                        "quality_sum": progress.get("quality_sum", 0.0),
+                        "quality_sumsq": progress.get("quality_sumsq", 0.0),
                         "connections": progress.get("connections", 0)
                     })
                     
@@ -82,18 +262,25 @@ class EtymologyGenerator:
             "start_time": time.time()
         }
     
-    def save_progress(self):
-        """Save progress to a file."""
+    def save_progress(self, force=False):
+        """Save progress to a file, at most once per progress_save_interval unless forced."""
+        now = time.time()
+        if not force and now - self.last_progress_save < self.progress_save_interval:
+            return
+        
         self.progress.update({
             "total_words": self.stats["total_words"],
             "processed_words": self.stats["processed_words"],
-            "quality_scores": self.stats["quality_scores"],
+            "quality_count": self.stats["quality_count"],
+            "quality_sum": self.stats["quality_sum"],
+            "quality_sumsq": self.stats["quality_sumsq"],
             "connections": self.stats["connections"],
-            "last_update": time.time()
+            "last_update": now
         })
         
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(self.progress, f, indent=2)
+        # write_bytes replaces the file atomically, so an interrupted save never corrupts the checkpoint
+        write_bytes(self.progress_file, orjson.dumps(self.progress, option=orjson.OPT_INDENT_2))
+        self.last_progress_save = now
         
         logger.info(f"Saved progress: {self.stats['processed_words']} of {self.stats['total_words']} words processed")
     
@@ -104,7 +291,10 @@ class EtymologyGenerator:
         elapsed_time = self.stats["end_time"] - self.stats["start_time"]
         words_per_second = self.stats["processed_words"] / elapsed_time if elapsed_time > 0 else 0
         
-        avg_quality = sum(self.stats["quality_scores"]) / len(self.stats["quality_scores"]) if self.stats["quality_scores"] else 0
+        quality_count = self.stats["quality_count"]
+        avg_quality = self.stats["quality_sum"] / quality_count if quality_count else 0
+        quality_variance = self.stats["quality_sumsq"] / quality_count - avg_quality ** 2 if quality_count else 0
+        quality_stddev = max(quality_variance, 0) ** 0.5
         avg_connections = self.stats["connections"] / self.stats["processed_words"] if self.stats["processed_words"] > 0 else 0
         
         summary = {
@@ -113,13 +303,13 @@ class EtymologyGenerator:
             "elapsed_time": elapsed_time,
             "words_per_second": words_per_second,
             "average_quality_score": avg_quality,
+            "quality_score_stddev": quality_stddev,
             "total_connections": self.stats["connections"],
             "average_connections_per_word": avg_connections,
             "timestamp": datetime.now().isoformat()
         }
         
-        with open(self.summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        write_bytes(self.summary_file, orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved summary to {self.summary_file}")
         
@@ -139,94 +329,39 @@ class EtymologyGenerator:
         
         print("=" * 40)
     
-    def load_word_list(self, word_list_file):
-        """Load a list of words from a file."""
+    def iter_word_list(self, word_list_file):
+        """Yield words from a file one line at a time."""
+        with open(word_list_file, 'rb') as f:
+            for line in f:
+                word = line.strip()
+                if word:
+                    yield word.decode('utf-8')
+    
+    def count_words(self, word_list_file):
+        """Count the words in a file without keeping them in memory."""
         try:
-            with open(word_list_file, 'r', encoding='utf-8') as f:
-                words = [line.strip() for line in f if line.strip()]
+            total = sum(1 for _ in self.iter_word_list(word_list_file))
             
-            self.stats["total_words"] = len(words)
-            logger.info(f"Loaded {len(words)} words from {word_list_file}")
-            return words
+            self.stats["total_words"] = total
+            logger.info(f"Found {total} words in {word_list_file}")
+            return total
         except Exception as e:
             logger.error(f"Error loading word list: {str(e)}")
-            return []
+            return 0
     
     def process_batch(self, batch, batch_index, total_batches, language="English"):
         """Process a batch of words and save the results."""
-        batch_size = len(batch)
-        batch_start_time = time.time()
-        
-        logger.info(f"Processing batch {batch_index + 1}/{total_batches} with {batch_size} words")
-        
-        results = {}
-        by_letter_results = {}
-        connections = 0
-        quality_scores = []
-        
-        for word in batch:
-            # Process the word
-            if self.use_sample_data and word.lower() in self.tester.sample_data:
-                result = self.tester.sample_data[word.lower()]
-                logger.info(f"Using sample data for {word}")
-            else:
-                result = self.tester.process_word(word, language)
-            
-            results[word] = result
-            
-            # Store by first letter if enabled
-            if self.store_by_first_letter and word:
-                first_letter = word[0].lower()
-                if first_letter.isalpha():
-                    if first_letter not in by_letter_results:
-                        by_letter_results[first_letter] = {}
-                    by_letter_results[first_letter][word] = result
-            
-            # Update statistics
-            quality_scores.append(result.get("quality_score", 0))
-            connections += len(result.get("roots", []))
-        
-        # Save batch results
-        if self.store_by_first_letter:
-            # Save each letter's results to its own directory
-            for letter, letter_results in by_letter_results.items():
-                letter_dir = self.output_dir / letter
-                os.makedirs(letter_dir, exist_ok=True)
-                
-                for word, result in letter_results.items():
-                    word_file = letter_dir / f"{word}.json"
-                    with open(word_file, 'w', encoding='utf-8') as f:
-                        json.dump(result, f, indent=2)
-                
-                logger.info(f"Saved {len(letter_results)} words in directory {letter_dir}")
-        else:
-            # Save all batch results to a single file
-            batch_file = self.output_dir / f"batch_{batch_index + 1}_of_{total_batches}.json"
-            with open(batch_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
-        
-        batch_elapsed_time = time.time() - batch_start_time
-        batch_wps = batch_size / batch_elapsed_time if batch_elapsed_time > 0 else 0
-        
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
-        avg_connections = connections / batch_size if batch_size > 0 else 0
-        
-        logger.info(f"Completed batch {batch_index + 1}/{total_batches} in {batch_elapsed_time:.2f}s")
-        logger.info(f"Batch stats: {batch_wps:.1f} words/s, Quality: {avg_quality:.1f}/100, Connections: {connections}")
-        
-        return {
-            "batch_index": batch_index,
-            "words_processed": batch_size,
-            "connections": connections,
-            "quality_scores": quality_scores,
-            "elapsed_time": batch_elapsed_time
-        }
+        return _process_batch(self.tester, batch, batch_index, total_batches, language,
+                              self.use_sample_data, self.store_by_first_letter, self.output_dir,
+                              self.ndjson, self.compress)
     
     def update_stats(self, batch_result):
         """Update overall statistics with batch results."""
         self.stats["processed_words"] += batch_result["words_processed"]
         self.stats["connections"] += batch_result["connections"]
-        self.stats["quality_scores"].extend(batch_result["quality_scores"])
+        self.stats["quality_count"] += batch_result["words_processed"]
+        self.stats["quality_sum"] += batch_result["quality_sum"]
+        self.stats["quality_sumsq"] += batch_result["quality_sumsq"]
         
         # Update progress
         self.progress["processed_words"] = self.stats["processed_words"]
@@ -249,14 +384,18 @@ class EtymologyGenerator:
             remaining_hours = remaining_time / 3600
             logger.info(f"Estimated time remaining: {remaining_time:.1f}s ({remaining_hours:.2f} hours)")
     
-    def run(self, word_list, batch_size=100, num_processes=1, language="English"):
+    def run(self, word_list, batch_size=100, num_processes=1, language="English", total_words=None):
         """Process all words in the list using multiprocessing for efficiency."""
-        if not word_list:
+        # word_list may be any iterable; a generator needs its size passed in
+        if total_words is None:
+            total_words = len(word_list)
+        
+        if not total_words:
             logger.warning("No words to process")
             return
         
         # Update total words count
-        self.stats["total_words"] = len(word_list)
+        self.stats["total_words"] = total_words
         
         # Skip words that were already processed
         if self.progress.get("processed_batches"):
@@ -264,30 +403,44 @@ class EtymologyGenerator:
         else:
             processed_batches = set()
         
-        # Calculate batches
-        num_batches = (len(word_list) + batch_size - 1) // batch_size
-        batches = []
+        # Calculate the batches still to do
+        num_batches = (total_words + batch_size - 1) // batch_size
+        pending = num_batches - len(processed_batches.intersection(range(num_batches)))
         
-        for i in range(num_batches):
-            if i not in processed_batches:
-                start_idx = i * batch_size
-                end_idx = min(start_idx + batch_size, len(word_list))
-                batches.append((word_list[start_idx:end_idx], i, num_batches))
+        logger.info(f"Processing {pending} batches of {batch_size} words each, using {num_processes} processes")
         
-        logger.info(f"Processing {len(batches)} batches of {batch_size} words each, using {num_processes} processes")
-        
-        if not batches:
+        if not pending:
             logger.info("All batches already processed")
             self.save_summary()
             return
         
+        # Pull each batch off the word stream only when it is about to be processed,
+        # still reading past the batches finished in an earlier run
+        words = iter(word_list)
+        chunks = iter(lambda: list(islice(words, batch_size)), [])
+        batches = ((batch, i, num_batches) for i, batch in enumerate(chunks) if i not in processed_batches)
+        
         # Process batches
-        if num_processes > 1 and len(batches) > 1:
+        if num_processes > 1 and pending > 1:
             # Use multiprocessing
-            process_func = partial(self._process_batch_wrapper, language=language)
+            tasks = ((batch, batch_idx, total_batches, language, self.use_sample_data,
+                      self.store_by_first_letter, self.output_dir, self.ndjson, self.compress)
+                     for batch, batch_idx, total_batches in batches)
+            
+            # Forked workers share the parent's tester copy-on-write; spawned ones
+            # (macOS/Windows) build their own in the initializer
+            global _WORKER_TESTER
+            if "fork" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("fork")
+                _WORKER_TESTER = self.tester
+                initializer = _init_forked_worker
+            else:
+                context = multiprocessing.get_context()
+                initializer = _init_worker
             
-            with multiprocessing.Pool(processes=num_processes) as pool:
-                for batch_result in pool.starmap(process_func, batches):
+            # Record each batch as soon as it finishes rather than after the whole pool drains
+            with context.Pool(processes=num_processes, initializer=initializer) as pool:
+                for batch_result in pool.imap_unordered(_process_batch_task, tasks, chunksize=1):
                     self.update_stats(batch_result)
         else:
             # Process sequentially
@@ -295,16 +448,11 @@ class EtymologyGenerator:
                 batch_result = self.process_batch(batch, batch_idx, total_batches, language)
                 self.update_stats(batch_result)
         
+        # Checkpoint whatever the throttle held back
+        self.save_progress(force=True)
+        
         # Save final summary
         self.save_summary()
-    
-    def _process_batch_wrapper(self, batch, batch_index, total_batches, language="English"):
-        """Wrapper for process_batch to be used with multiprocessing."""
-        # Create a new tester instance for this process
-        tester = SimpleEtymologyTester()
-        self.tester = tester
-        
-        return self.process_batch(batch, batch_index, total_batches, language)
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -316,6 +464,8 @@ def parse_arguments():
     parser.add_argument('--language', type=str, default='English', help='Language of the word list')
     parser.add_argument('--use-sample', action='store_true', help='Use sample data for known words')
     parser.add_argument('--store-by-first-letter', action='store_true', help='Store words in directories by first letter')
+    parser.add_argument('--ndjson', action='store_true', help='With --store-by-first-letter, write one NDJSON file per letter and batch instead of a file per word')
+    parser.add_argument('--compress', choices=['none', 'gz'], default='none', help='Compress word and batch output files (gz writes unindented JSON)')
     
     return parser.parse_args()
 
@@ -327,20 +477,23 @@ def main():
     generator = EtymologyGenerator(
         output_dir=args.output_dir,
         use_sample_data=args.use_sample,
-        store_by_first_letter=args.store_by_first_letter
+        store_by_first_letter=args.store_by_first_letter,
+        ndjson=args.ndjson,
+        compress=args.compress
     )
     
-    # Load the word list
-    word_list = generator.load_word_list(args.word_list)
+    # Count the word list; the words themselves are streamed during the run
+    total_words = generator.count_words(args.word_list)
     
-    if not word_list:
+    if not total_words:
         logger.error("No words loaded. Exiting.")
         return 1
     
     try:
         # Run the generator
         generator.run(
-            word_list=word_list,
+            word_list=generator.iter_word_list(args.word_list),
+            total_words=total_words,
             batch_size=args.batch_size,
             num_processes=args.processes,
             language=args.language
@@ -352,13 +505,15 @@ def main():
         return 0
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
-        generator.save_progress()
+        generator.save_progress(force=True)
         generator.save_summary()
         return 2
     except Exception as e:
         logger.error(f"Error during processing: {str(e)}", exc_info=True)
-        generator.save_progress()
+        generator.save_progress(force=True)
         return 1
+    finally:
+        generator.tester.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -20,15 +20,20 @@ class DataSourcesTest:
         self.cache_dir = os.path.join(".", "cache")
         self.data_sources = {}
         
-        # Ensure cache directories exist
+        # Cache directory for each source, built once and reused by the init_* methods
+        self.source_dirs = {source: os.path.join(self.cache_dir, source) for source in self.sources}
+        
+        # Ensure cache directories exist, creating only the ones that are missing
         os.makedirs(self.cache_dir, exist_ok=True)
-        for source in self.sources:
-            source_dir = os.path.join(self.cache_dir, source)
-            os.makedirs(source_dir, exist_ok=True)
+        with os.scandir(self.cache_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        for source, source_dir in self.source_dirs.items():
+            if source not in existing:
+                os.mkdir(source_dir)
             
     def init_wiktionary_source(self):
         """Initialize the Wiktionary data source."""
-        wiktionary_cache = os.path.join(self.cache_dir, "wiktionary")
+        wiktionary_cache = self.source_dirs["wiktionary"]
         wiktionary_index = os.path.join(wiktionary_cache, "index.json")
         
         if not os.path.exists(wiktionary_index):
@@ -40,22 +45,22 @@ class DataSourcesTest:
 
     def init_etymonline_source(self):
         """Initialize the Etymonline data source."""
-        etymonline_cache = os.path.join(self.cache_dir, "etymonline")
+        etymonline_cache = self.source_dirs["etymonline"]
         return {"cache_dir": etymonline_cache}
 
     def init_etymwordnet_source(self):
         """Initialize the etymological wordnet data source."""
-        etymwordnet_cache = os.path.join(self.cache_dir, "etymwordnet")
+        etymwordnet_cache = self.source_dirs["etymwordnet"]
         return {"cache_dir": etymwordnet_cache}
 
     def init_ielex_source(self):
         """Initialize the University of Texas Indo-European Lexicon source."""
-        ielex_cache = os.path.join(self.cache_dir, "ielex")
+        ielex_cache = self.source_dirs["ielex"]
         return {"cache_dir": ielex_cache, "base_url": "https://lrc.la.utexas.edu/lex/master"}
         
     def init_starling_source(self):
         """Initialize the Tower of Babel (Starling) database source."""
-        starling_cache = os.path.join(self.cache_dir, "starling")
+        starling_cache = self.source_dirs["starling"]
         return {"cache_dir": starling_cache, "base_url": "https://starling.rinet.ru/cgi-bin/response.cgi"}
         
     def load_data_sources(self):
@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
 import os
-import json
+import argparse
+import pprint
+import hashlib
 import time
 import logging
 import requests
 import re
+import queue
+import threading
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from bs4 import BeautifulSoup
+from tqdm import tqdm
+import lxml.html
+from lxml import etree
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -15,10 +29,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger("etymology_test")
 
+# Regular expressions used while parsing etymology text, compiled once
+_PERIOD_PREFIX = r'(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?'
+WIKTIONARY_YEAR_RE = re.compile(r'(?:from|attested|circa|around|c\.|ca\.)?\s*(\d{3,4})(?:\s*(?:BC|BCE|AD|CE|s|century))?')
+WIKTIONARY_DEFINITION_RE = re.compile(r'meaning ["\']([^"\']+)["\']')
+WIKTIONARY_ROOT_PATTERNS = [
+    re.compile(r'from\s+(?:the\s+)?' + _PERIOD_PREFIX + r'\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)'),
+    re.compile(r'borrowed from\s+(?:the\s+)?' + _PERIOD_PREFIX + r'\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)'),
+    re.compile(r'derived from\s+(?:the\s+)?' + _PERIOD_PREFIX + r'\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)')
+]
+# A four-digit year anywhere wins over a century reference, so these stay two searches
+ETYMONLINE_YEAR_RE = re.compile(r'(?:from|attested|circa|c\.|ca\.)?\s*(\d{4})')
+ETYMONLINE_CENTURY_RE = re.compile(r'(?:(?:early|mid|late) )?(\d{1,2})(?:st|nd|rd|th) c(?:entury)?')
+ETYMONLINE_DEFINITION_RE = re.compile(r'"([^"]*)')
+ETYMONLINE_ROOT_PATTERNS = [
+    re.compile(r'from\s+(?:the\s+)?' + _PERIOD_PREFIX + r'\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)'),
+    re.compile(r'from\s+(?:the\s+)?' + _PERIOD_PREFIX + r'\s*([A-Z][a-z]+)\s+["\']([^"\']+)["\']'),
+    re.compile(_PERIOD_PREFIX + r'\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)'),
+    re.compile(r'< (?:' + _PERIOD_PREFIX + r')?\s*([A-Z][a-z]+)[.\s]+([^,.<]+)')
+]
+ROOT_PUNCTUATION_RE = re.compile(r'[,.;:!?\'"()]')
+
+# Approximate period of each root language, used when a root has no attested year
+ROOT_LANGUAGE_YEARS = {
+    "Latin": -100,  # Classical Latin period
+    "Ancient Greek": -400,  # Classical Greek period
+    "Greek": -400,
+    "Proto-Indo-European": -4500,  # Estimated PIE period
+    "Old French": 1000,  # Old French period
+    "Middle English": 1300,  # Middle English period
+    "Old English": 900  # Old English period
+}
+
+WIKTIONARY_API_URL = "https://en.wiktionary.org/w/api.php"
+
+# Wiktionary section lookups, evaluated by libxml2 rather than walked node by node.
+# A heading's title is the first span with the mw-headline class inside it.
+_HEADLINE = "(.//span[contains(concat(' ', normalize-space(@class), ' '), ' mw-headline ')])[1]"
+WIKTIONARY_LANGUAGE_XPATH = etree.XPath(f"(//h2[normalize-space({_HEADLINE}) = $language])[1]")
+# First Etymology h3 after a language h2, provided no other h2 comes before it
+WIKTIONARY_SECTION_ETYMOLOGY_XPATH = etree.XPath(
+    f"following-sibling::*[self::h2 or (self::h3 and contains({_HEADLINE}, 'Etymology'))][1][self::h3]")
+WIKTIONARY_ETYMOLOGY_XPATH = etree.XPath(f"(//h3[contains({_HEADLINE}, 'Etymology')])[1]")
+
 class SimpleEtymologyTester:
     """A simplified etymology tester to demonstrate the system without using the full generator."""
     
-    def __init__(self):
+    def __init__(self, max_workers=16):
         """Initialize the tester."""
         # Use paths relative to script location
         script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
@@ -26,10 +83,37 @@ class SimpleEtymologyTester:
         self.output_dir = script_dir / "test_output"
         os.makedirs(self.cache_dir, exist_ok=True)
         os.makedirs(self.output_dir, exist_ok=True)
-        self.results = {}
+        self.results = {}  # (language, word) -> etymology data
+        
+        self.max_workers = max_workers
+        self.init_fetch_state()
+        
+        # Recently used cache entries, kept serialized in front of the disk cache
+        self.memory_cache = OrderedDict()
+        self.memory_cache_size = 4096
         
-        # Load sample data for demonstration
-        self.sample_data = self.load_sample_data()
+        # Load sample data for demonstration, keyed by lower-cased word
+        self.sample_data = {word.lower(): data for word, data in self.load_sample_data().items()}
+    
+    def init_fetch_state(self):
+        """Create the HTTP session, fetch thread pool and cache lock; forked worker processes call it again."""
+        # Reuse connections across requests; fetches spend most of their time waiting on the network
+        self.session = requests.Session()
+        # Only advertise encodings urllib3 can decode here (br needs brotli installed)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+        })
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers * 2,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.session.mount("https://", adapter)
+        self.fetch_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.memory_cache_lock = threading.Lock()
+    
+    def close(self):
+        """Stop the fetch threads and release the session's pooled connections."""
+        self.fetch_executor.shutdown()
+        self.session.close()
         
     def load_sample_data(self):
         """Load sample etymology data for demonstration."""
@@ -140,13 +224,75 @@ class SimpleEtymologyTester:
         
         return sample_data
         
+    def cache_path(self, source, language, word):
+        """Return the cache file for a fetch, sharded into two levels of hash-prefixed directories."""
+        digest = hashlib.blake2b(f"{source}|{language}|{word}".encode("utf-8"), digest_size=2).hexdigest()
+        return self.cache_dir / digest[:2] / digest[2:] / f"{language}_{word}_{source}.json"
+    
+    def legacy_cache_path(self, source, language, word):
+        """Return where a fetch was cached before the cache was sharded."""
+        return self.cache_dir / f"{language}_{word}_{source}.json"
+    
+    def read_cache(self, source, language, word):
+        """Return a cached fetch result, checking memory before disk, or None on a miss."""
+        key = (source, language, word)
+        with self.memory_cache_lock:
+            payload = self.memory_cache.get(key)
+            if payload is not None:
+                self.memory_cache.move_to_end(key)
+        
+        if payload is None:
+            payload = self.read_cache_file(source, language, word)
+            if payload is None:
+                return None
+            self.remember_cache(key, payload)
+        
+        # Decode per call so callers never share (and mutate) the same dicts
+        return orjson.loads(payload)
+    
+    def read_cache_file(self, source, language, word):
+        """Return a fetch's cached bytes from disk, moving a flat (pre-sharding) cache file into its shard."""
+        cache_file = self.cache_path(source, language, word)
+        try:
+            with open(cache_file, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+        
+        legacy_file = self.legacy_cache_path(source, language, word)
+        try:
+            with open(legacy_file, 'rb') as f:
+                payload = f.read()
+        except FileNotFoundError:
+            return None
+        
+        # Move it so later lookups hit the sharded path directly; reading it again next run is harmless if this fails
+        try:
+            os.makedirs(cache_file.parent, exist_ok=True)
+            os.replace(legacy_file, cache_file)
+        except OSError as e:
+            logger.warning("Could not move %s into the sharded cache: %s", legacy_file, e)
+        return payload
+    
+    def write_cache(self, source, language, word, result):
+        """Write a fetch result to the disk cache and keep it in memory."""
+        payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+        cache_file = self.cache_path(source, language, word)
+        os.makedirs(cache_file.parent, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            f.write(payload)
+        self.remember_cache((source, language, word), payload)
+    
+    def remember_cache(self, key, payload):
+        """Keep a serialized fetch result in the in-memory LRU cache."""
+        with self.memory_cache_lock:
+            self.memory_cache[key] = payload
+            self.memory_cache.move_to_end(key)
+            if len(self.memory_cache) > self.memory_cache_size:
+                self.memory_cache.popitem(last=False)
+    
     def fetch_from_wiktionary(self, word, language="English"):
         """Fetch etymology from Wiktionary."""
-        # Check if we have sample data for this word
-        if word.lower() in self.sample_data:
-            logger.info(f"Using sample data for {word}")
-            return self.sample_data[word.lower()]
-        
         result = {
             "word": word,
             "language": language,
@@ -156,75 +302,67 @@ class SimpleEtymologyTester:
         }
         
         # Check cache first
-        cache_file = self.cache_dir / f"{language}_{word}_wiktionary.json"
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        cached = self.read_cache("wiktionary", language, word)
+        if cached is not None:
+            return cached
         
         try:
-            # Construct the Wiktionary URL
-            wiktionary_url = f"https://en.wiktionary.org/wiki/{word}"
+            # Ask the MediaWiki API for just the rendered article body, without the site chrome
+            wiktionary_params = {
+                "action": "parse",
+                "page": word,
+                "prop": "text",
+                "format": "json",
+                "formatversion": "2",
+                "redirects": "1",
+                "disableeditsection": "1",
+                "disabletoc": "1"
+            }
             
-            logger.info(f"Fetching from Wiktionary: {wiktionary_url}")
+            logger.info("Fetching from Wiktionary: %s?page=%s", WIKTIONARY_API_URL, word)
             
             # Fetch the page
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(wiktionary_url, headers=headers, timeout=10)
+            response = self.session.get(WIKTIONARY_API_URL, params=wiktionary_params, timeout=10)
             
             if response.status_code != 200:
-                logger.warning(f"Failed to fetch Wiktionary page: {response.status_code}")
+                logger.warning("Failed to fetch Wiktionary page: %s", response.status_code)
+                return result
+            
+            # Missing pages still come back as 200, with an error object instead of "parse"
+            page = orjson.loads(response.content).get("parse")
+            if not page:
+                logger.warning("No Wiktionary page for %s", word)
                 return result
             
             # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml.html.fromstring(page["text"])
             
-            # Find the etymology section
+            # Look for the Etymology heading inside the language section first
             etymology_section = None
-            
-            # Look for the language section first
-            language_header = None
-            for h2 in soup.find_all('h2'):
-                span = h2.find('span', class_='mw-headline')
-                if span and span.get_text().strip() == language:
-                    language_header = h2
-                    break
-            
-            # If we found the language section, look for the etymology section
+            language_header = WIKTIONARY_LANGUAGE_XPATH(tree, language=language)
             if language_header:
-                current = language_header.next_sibling
-                while current and not (hasattr(current, 'name') and current.name == 'h2'):
-                    if hasattr(current, 'name') and current.name == 'h3':
-                        span = current.find('span', class_='mw-headline')
-                        if span and 'Etymology' in span.get_text():
-                            etymology_section = current
-                            break
-                    current = current.next_sibling
+                etymology_section = WIKTIONARY_SECTION_ETYMOLOGY_XPATH(language_header[0])
             
             # If we didn't find it, try looking for a general etymology section
             if not etymology_section:
-                for h3 in soup.find_all('h3'):
-                    span = h3.find('span', class_='mw-headline')
-                    if span and 'Etymology' in span.get_text():
-                        etymology_section = h3
-                        break
+                etymology_section = WIKTIONARY_ETYMOLOGY_XPATH(tree)
             
-            # Extract the etymology text if we found a section
-            etymology_text = ""
+            # Extract the etymology text up to the next heading
+            etymology_parts = []
             if etymology_section:
-                current = etymology_section.next_sibling
-                while current and not (hasattr(current, 'name') and current.name in ['h2', 'h3']):
-                    if hasattr(current, 'get_text'):
-                        etymology_text += current.get_text() + " "
-                    current = current.next_sibling
+                for sibling in etymology_section[0].itersiblings():
+                    if sibling.tag in ('h2', 'h3'):
+                        break
+                    if isinstance(sibling.tag, str):
+                        etymology_parts.append(sibling.text_content())
+            etymology_text = " ".join(etymology_parts)
             
-            logger.info(f"Etymology text: {etymology_text[:200]}...")
+            logger.info("Etymology text: %.200s...", etymology_text)
             
             # Parse the etymology text
             if etymology_text:
                 # Try to extract year
-                year_match = re.search(r'(?:from|attested|circa|around|c\.|ca\.)?\s*(\d{3,4})(?:\s*(?:BC|BCE|AD|CE|s|century))?', etymology_text)
+                year_match = WIKTIONARY_YEAR_RE.search(etymology_text)
                 if year_match:
                     year_text = year_match.group(1)
                     year = int(year_text)
@@ -238,74 +376,29 @@ class SimpleEtymologyTester:
                         year = year * 100 - 50  # mid-century approximation
                     
                     result["year"] = year
-                    logger.info(f"Extracted year: {year}")
+                    logger.info("Extracted year: %s", year)
                 
                 # Try to extract definition
-                definition_match = re.search(r'meaning ["\']([^"\']+)["\']', etymology_text)
+                definition_match = WIKTIONARY_DEFINITION_RE.search(etymology_text)
                 if definition_match:
                     result["definition"] = definition_match.group(1).strip()
-                    logger.info(f"Extracted definition: {result['definition']}")
+                    logger.info("Extracted definition: %s", result['definition'])
                 
                 # Try to extract root words
                 # Look for patterns like "from [Language] [word]"
-                root_patterns = [
-                    r'from\s+(?:the\s+)?(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)',
-                    r'borrowed from\s+(?:the\s+)?(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)',
-                    r'derived from\s+(?:the\s+)?(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)'
-                ]
-                
-                for pattern in root_patterns:
-                    for match in re.finditer(pattern, etymology_text):
-                        root_language = match.group(1).strip()
-                        root_word = match.group(2).strip()
-                        
-                        # Clean up the root word
-                        root_word = re.sub(r'[,.;:!?\'"()]', '', root_word).strip()
-                        
-                        # Create the root object
-                        root = {
-                            "word": root_word,
-                            "language": root_language,
-                            "year": None,
-                            "definition": ""
-                        }
-                        
-                        # Estimate year based on language
-                        if root_language == "Latin":
-                            root["year"] = -100  # Classical Latin period
-                        elif root_language == "Ancient Greek" or root_language == "Greek":
-                            root["year"] = -400  # Classical Greek period
-                        elif root_language == "Proto-Indo-European":
-                            root["year"] = -4500  # Estimated PIE period
-                        elif root_language == "Old French":
-                            root["year"] = 1000  # Old French period
-                        elif root_language == "Middle English":
-                            root["year"] = 1300  # Middle English period
-                        elif root_language == "Old English":
-                            root["year"] = 900  # Old English period
-                        
-                        # Add the root if not already present
-                        if not any(r.get("word") == root_word and r.get("language") == root_language for r in result["roots"]):
-                            result["roots"].append(root)
-                            logger.info(f"Added root: {root_word} ({root_language})")
+                result["roots"] = self.extract_roots(etymology_text, WIKTIONARY_ROOT_PATTERNS)
             
             # Cache the result
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+            self.write_cache("wiktionary", language, word, result)
             
             return result
             
         except Exception as e:
-            logger.error(f"Error fetching from Wiktionary: {str(e)}")
+            logger.error("Error fetching from Wiktionary: %s", e)
             return result
             
     def fetch_from_etymonline(self, word, language="English"):
         """Fetch etymology from Etymonline."""
-        # Check if we have sample data for this word
-        if word.lower() in self.sample_data:
-            logger.info(f"Using sample data for {word}")
-            return self.sample_data[word.lower()]
-        
         result = {
             "word": word,
             "language": language,
@@ -316,33 +409,29 @@ class SimpleEtymologyTester:
         
         # Etymonline only handles English words
         if language != "English":
-            logger.info(f"Etymonline only supports English, not {language}")
+            logger.info("Etymonline only supports English, not %s", language)
             return result
         
         # Check cache first
-        cache_file = self.cache_dir / f"{language}_{word}_etymonline.json"
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        cached = self.read_cache("etymonline", language, word)
+        if cached is not None:
+            return cached
         
         try:
             # Construct the URL
             etymonline_url = f"https://www.etymonline.com/search?q={word}"
             
-            logger.info(f"Fetching from Etymonline: {etymonline_url}")
+            logger.info("Fetching from Etymonline: %s", etymonline_url)
             
             # Fetch the page
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(etymonline_url, headers=headers, timeout=15)
+            response = self.session.get(etymonline_url, timeout=15)
             
             if response.status_code != 200:
-                logger.warning(f"Failed to fetch Etymonline page: {response.status_code}")
+                logger.warning("Failed to fetch Etymonline page: %s", response.status_code)
                 return result
             
             # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Find the etymology entry
             word_section = None
@@ -378,112 +467,84 @@ class SimpleEtymologyTester:
                                 etymology_text = def_elem.get_text()
                                 break
             
-            logger.info(f"Etymology text: {etymology_text[:200]}...")
+            logger.info("Etymology text: %.200s...", etymology_text)
             
             # Parse the etymology text
             if etymology_text:
                 # Try to extract year
-                year_patterns = [
-                    r'(?:from|attested|circa|c\.|ca\.)?\s*(\d{4})',  # Standard year format
-                    r'(\d{1,2})(?:st|nd|rd|th) c(?:entury)?',  # Century format
-                    r'(?:early|mid|late) (\d{1,2})(?:st|nd|rd|th) c(?:entury)?'  # Early/mid/late century
-                ]
-                
-                for pattern in year_patterns:
-                    year_match = re.search(pattern, etymology_text)
-                    if year_match:
-                        year_text = year_match.group(1)
-                        try:
-                            # Century to year conversion
-                            if 'century' in year_match.group(0) or 'c.' in year_match.group(0):
-                                century = int(year_text)
-                                # Early century: first quarter, Mid: mid-point, Late: last quarter
-                                if 'early' in year_match.group(0):
-                                    year = (century - 1) * 100 + 25
-                                elif 'late' in year_match.group(0):
-                                    year = (century - 1) * 100 + 75
-                                else:
-                                    year = (century - 1) * 100 + 50
-                            else:
-                                year = int(year_text)
-                                
-                            result["year"] = year
-                            logger.info(f"Extracted year: {year}")
-                            break
-                        except ValueError:
-                            continue
+                year_match = ETYMONLINE_YEAR_RE.search(etymology_text) or ETYMONLINE_CENTURY_RE.search(etymology_text)
+                if year_match:
+                    year = int(year_match.group(1))
+                    matched = year_match.group(0)
+                    
+                    # Century to year conversion
+                    if 'century' in matched or 'c.' in matched:
+                        # Early century: first quarter, Mid: mid-point, Late: last quarter
+                        if 'early' in matched:
+                            year = (year - 1) * 100 + 25
+                        elif 'late' in matched:
+                            year = (year - 1) * 100 + 75
+                        else:
+                            year = (year - 1) * 100 + 50
+                    
+                    result["year"] = year
+                    logger.info("Extracted year: %s", year)
                 
                 # Try to extract definition - often at the beginning
-                definition_parts = etymology_text.split('", ')
-                if len(definition_parts) > 1:
-                    # The definition is often before a quote
-                    quote_parts = etymology_text.split('"')
-                    if len(quote_parts) > 1:
-                        result["definition"] = quote_parts[1].strip()
-                        logger.info(f"Extracted definition: {result['definition']}")
+                if '", ' in etymology_text:
+                    # The definition is the first quoted text
+                    definition_match = ETYMONLINE_DEFINITION_RE.search(etymology_text)
+                    result["definition"] = definition_match.group(1).strip()
+                    logger.info("Extracted definition: %s", result['definition'])
                 
                 # Try to extract root words
                 # Etymonline often uses patterns like "from [Language] [word]"
-                root_patterns = [
-                    r'from\s+(?:the\s+)?(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)',
-                    r'from\s+(?:the\s+)?(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?\s*([A-Z][a-z]+)\s+["\']([^"\']+)["\']',
-                    r'(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?\s*([A-Z][a-z]+)\s+(?:word\s+)?["\']?([^,."\']+)',
-                    r'< (?:(?:Old|Middle|Ancient|Classical|Modern|Proto)?-?)?\s*([A-Z][a-z]+)[.\s]+([^,.<]+)'
-                ]
-                
-                for pattern in root_patterns:
-                    for match in re.finditer(pattern, etymology_text):
-                        root_language = match.group(1).strip()
-                        root_word = match.group(2).strip()
-                        
-                        # Clean up the root word
-                        root_word = re.sub(r'[,.;:!?\'"()]', '', root_word).strip()
-                        
-                        # Create the root object
-                        root = {
-                            "word": root_word,
-                            "language": root_language,
-                            "year": None,
-                            "definition": ""
-                        }
-                        
-                        # Estimate year based on language
-                        if root_language == "Latin":
-                            root["year"] = -100  # Classical Latin period
-                        elif root_language == "Ancient Greek" or root_language == "Greek":
-                            root["year"] = -400  # Classical Greek period
-                        elif root_language == "Proto-Indo-European":
-                            root["year"] = -4500  # Estimated PIE period
-                        elif root_language == "Old French":
-                            root["year"] = 1000  # Old French period
-                        elif root_language == "Middle English":
-                            root["year"] = 1300  # Middle English period
-                        elif root_language == "Old English":
-                            root["year"] = 900  # Old English period
-                        
-                        # Add the root if not already present
-                        if not any(r.get("word") == root_word and r.get("language") == root_language for r in result["roots"]):
-                            result["roots"].append(root)
-                            logger.info(f"Added root: {root_word} ({root_language})")
+                result["roots"] = self.extract_roots(etymology_text, ETYMONLINE_ROOT_PATTERNS)
             
             # Cache the result
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+            self.write_cache("etymonline", language, word, result)
             
             return result
             
         except Exception as e:
-            logger.error(f"Error fetching from Etymonline: {str(e)}")
+            logger.error("Error fetching from Etymonline: %s", e)
             return result
      
+    def extract_roots(self, etymology_text, patterns):
+        """Collect unique root words matched by any of the patterns, in match order."""
+        roots = []
+        seen = set()
+        
+        for pattern in patterns:
+            for match in pattern.finditer(etymology_text):
+                root_language = match.group(1).strip()
+                
+                # Clean up the root word
+                root_word = ROOT_PUNCTUATION_RE.sub('', match.group(2).strip()).strip()
+                
+                # Add the root if not already present
+                if (root_word, root_language) in seen:
+                    continue
+                seen.add((root_word, root_language))
+                
+                roots.append({
+                    "word": root_word,
+                    "language": root_language,
+                    "year": ROOT_LANGUAGE_YEARS.get(root_language),  # Estimate year based on language
+                    "definition": ""
+                })
+                logger.info("Added root: %s (%s)", root_word, root_language)
+        
+        return roots
+    
     def process_word(self, word, language="English"):
         """Process a word and return its etymology data."""
-        logger.info(f"Processing word: {word} ({language})")
+        logger.info("Processing word: %s (%s)", word, language)
         
-        # Check if we have sample data for this word
-        if word.lower() in self.sample_data:
-            result = self.sample_data[word.lower()]
-            logger.info(f"Using sample data for {word}")
+        # Check if we have sample data for this word; the fetchers below never see sampled words
+        result = self.sample_data.get(word.lower())
+        if result is not None:
+            logger.info("Using sample data for %s", word)
             return result
         
         # Initialize result
@@ -495,25 +556,30 @@ class SimpleEtymologyTester:
             "roots": []
         }
         
+        # Fetch Etymonline (English only) in the background while Wiktionary is fetched here
+        etymonline_future = None
+        if language == "English":
+            etymonline_future = self.fetch_executor.submit(self.fetch_from_etymonline, word)
+        
         # Get data from Wiktionary
         wiktionary_data = self.fetch_from_wiktionary(word, language)
         if wiktionary_data and wiktionary_data.get("roots"):
             self.merge_etymology_data(result, wiktionary_data)
-            logger.info(f"Added Wiktionary data for {word}")
+            logger.info("Added Wiktionary data for %s", word)
         
         # Get data from Etymonline (English only)
-        if language == "English":
-            etymonline_data = self.fetch_from_etymonline(word)
+        if etymonline_future is not None:
+            etymonline_data = etymonline_future.result()
             if etymonline_data and etymonline_data.get("roots"):
                 self.merge_etymology_data(result, etymonline_data)
-                logger.info(f"Added Etymonline data for {word}")
+                logger.info("Added Etymonline data for %s", word)
         
         # Calculate quality score
         quality_score = self.evaluate_quality(result)
         result["quality_score"] = quality_score
         
         # Store in results
-        self.results[f"{language}_{word}"] = result
+        self.results[(language, word)] = result
         
         return result
         
@@ -530,30 +596,32 @@ class SimpleEtymologyTester:
             
         # Merge roots, avoiding duplicates
         if source.get("roots"):
+            # Index the target's roots by (word, language); the first occurrence wins
+            root_index = {}
+            for existing_root in target.get("roots", []):
+                root_index.setdefault((existing_root.get("word"), existing_root.get("language")), existing_root)
+            
             for new_root in source["roots"]:
-                # Check if this root already exists
-                exists = False
-                for existing_root in target.get("roots", []):
-                    if (existing_root.get("word") == new_root.get("word") and 
-                        existing_root.get("language") == new_root.get("language")):
-                        exists = True
-                        # Update year or definition if not set
-                        if not existing_root.get("year") and new_root.get("year"):
-                            existing_root["year"] = new_root["year"]
-                        if not existing_root.get("definition") and new_root.get("definition"):
-                            existing_root["definition"] = new_root["definition"]
-                        break
-                
-                if not exists:
+                key = (new_root.get("word"), new_root.get("language"))
+                existing_root = root_index.get(key)
+                if existing_root is not None:
+                    # Update year or definition if not set
+                    if not existing_root.get("year") and new_root.get("year"):
+                        existing_root["year"] = new_root["year"]
+                    if not existing_root.get("definition") and new_root.get("definition"):
+                        existing_root["definition"] = new_root["definition"]
+                else:
                     target.setdefault("roots", []).append(new_root)
+                    root_index[key] = new_root
     
     def evaluate_quality(self, etymology_data):
         """Evaluate the quality of etymology data on a scale of 0-100."""
         score = 0
+        roots = etymology_data.get("roots") or ()
+        num_roots = len(roots)
         
         # Has roots (25 points)
-        if etymology_data.get("roots"):
-            num_roots = len(etymology_data["roots"])
+        if num_roots:
             score += min(25, num_roots * 10)
         
         # Has year (20 points)
@@ -561,29 +629,20 @@ class SimpleEtymologyTester:
             score += 20
         
         # Has definition (20 points)
-        if etymology_data.get("definition"):
-            definition_len = len(etymology_data["definition"])
-            score += min(20, definition_len // 5)
+        definition = etymology_data.get("definition")
+        if definition:
+            score += min(20, len(definition) // 5)
         
         # Check for comprehensive root data (35 points)
-        root_quality_score = 0
-        for root in etymology_data.get("roots", []):
-            root_score = 0
-            # Root has language (5 points)
-            if root.get("language"):
-                root_score += 5
-            # Root has year (5 points)
-            if root.get("year"):
-                root_score += 5
-            # Root has definition (5 points)
-            if root.get("definition"):
-                root_score += 5
-            
-            root_quality_score += root_score
-        
-        # Average the root quality and scale to 35 points
-        if etymology_data.get("roots"):
-            root_quality_avg = root_quality_score / len(etymology_data["roots"])
+        if num_roots:
+            # Each root earns 5 points apiece for a language, a year and a definition
+            root_quality_score = 0
+            for root in roots:
+                get = root.get
+                root_quality_score += 5 * (bool(get("language")) + bool(get("year")) + bool(get("definition")))
+            
+            # Average the root quality and scale to 35 points
+            root_quality_avg = root_quality_score / num_roots
             score += min(35, root_quality_avg * 2)
         
         return min(100, score)
@@ -591,12 +650,14 @@ class SimpleEtymologyTester:
     def run_test(self, words, language="English"):
         """Process a list of words and return the results."""
         results = {}
-        for word in words:
-            result = self.process_word(word, language)
-            results[word] = result
-            
-            # Print a summary
-            self.print_etymology_summary(result)
+        
+        # Words are fetched concurrently; summaries are still printed in input order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for word, result in zip(words, executor.map(lambda w: self.process_word(w, language), words)):
+                results[word] = result
+                
+                # Print a summary
+                self.print_etymology_summary(result)
             
         return results
     
@@ -610,7 +671,8 @@ class SimpleEtymologyTester:
         
         print(f"\n=== Etymology Summary for {word} ({language}) ===")
         print(f"Year: {year}")
-        print(f"Definition: {definition[:100]}..." if len(definition) > 100 else f"Definition: {definition}")
+        definition_suffix = "..." if len(definition) > 100 else ""
+        print(f"Definition: {definition[:100]}{definition_suffix}")
         print(f"Quality Score: {quality_score:.1f}/100")
         
         roots = etymology_data.get("roots", [])
@@ -624,7 +686,8 @@ class SimpleEtymologyTester:
                 
                 print(f"  {i}. {root_word} ({root_lang}), Year: {root_year}")
                 if root_def:
-                    print(f"     Definition: {root_def[:50]}..." if len(root_def) > 50 else f"     Definition: {root_def}")
+                    root_def_suffix = "..." if len(root_def) > 50 else ""
+                    print(f"     Definition: {root_def[:50]}{root_def_suffix}")
         else:
             print("\nNo root words found")
         
@@ -637,74 +700,147 @@ class SimpleEtymologyTester:
         
         os.makedirs(output_dir, exist_ok=True)
         
-        for key, data in self.results.items():
-            output_file = Path(output_dir) / f"{key}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+        for (language, word), data in self.results.items():
+            output_file = Path(output_dir) / f"{language}_{word}.json"
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
                 
-        logger.info(f"Saved {len(self.results)} results to {output_dir}")
+        logger.info("Saved %d results to %s", len(self.results), output_dir)
+    
+    def save_results_jsonl(self, output_file=None):
+        """Save all results to a single JSON Lines file, one result per line."""
+        if output_file is None:
+            output_file = self.output_dir / "results.jsonl"
+        
+        os.makedirs(Path(output_file).parent, exist_ok=True)
+        
+        payload = b"".join(orjson.dumps({"language": language, "word": word, **data}) + b"\n"
+                           for (language, word), data in self.results.items())
+        with open(output_file, "wb") as f:
+            f.write(payload)
+        
+        logger.info("Saved %d results to %s", len(self.results), output_file)
     
     def check_for_duplicates(self):
         """Check for duplicates in the etymology data."""
         duplicate_count = 0
         
-        for key, data in self.results.items():
+        for data in self.results.values():
             roots = data.get("roots", [])
-            root_set = set()
+            root_keys = [(root.get('word'), root.get('language')) for root in roots]
             
-            for root in roots:
-                root_key = f"{root.get('word')}|{root.get('language')}"
+            # Most words have no duplicates; only walk the roots again to report the ones that do
+            if len(set(root_keys)) == len(root_keys):
+                continue
+            
+            root_set = set()
+            for root_key in root_keys:
                 if root_key in root_set:
                     duplicate_count += 1
-                    logger.warning(f"Duplicate root found for {data.get('word')}: {root.get('word')} ({root.get('language')})")
+                    logger.warning("Duplicate root found for %s: %s (%s)", data.get('word'), *root_key)
                 else:
                     root_set.add(root_key)
         
-        logger.info(f"Found {duplicate_count} duplicates in the etymology data")
+        logger.info("Found %d duplicates in the etymology data", duplicate_count)
         return duplicate_count
 
-    def process_batch(self, word_list, language="English", batch_size=10):
+    def process_batch(self, word_list, language="English", batch_size=10, resume=False, verbose=False):
         """Process a batch of words, demonstrating the recovery capability."""
         total_words = len(word_list)
         results = {}
-        start_time = time.time()
         
         print(f"\nProcessing {total_words} words in batches of {batch_size}...")
         
-        for i in range(0, total_words, batch_size):
-            batch = word_list[i:i+batch_size]
-            print(f"\nBatch {i//batch_size + 1}/{(total_words + batch_size - 1)//batch_size}")
-            
-            for word in batch:
-                result = self.process_word(word, language)
-                results[word] = result
-                
-                # Print a short status
-                if result.get("roots"):
-                    print(f"  ✓ {word}: Found {len(result['roots'])} roots")
-                else:
-                    print(f"  ✗ {word}: No roots found")
-            
-            # Save partial results to demonstrate recovery capability
-            batch_dir = self.output_dir / "batches"
-            os.makedirs(batch_dir, exist_ok=True)
-            with open(batch_dir / f"partial_batch_{i//batch_size}.json", "w", encoding="utf-8") as f:
-                partial_results = {word: results[word] for word in word_list[:i+len(batch)]}
-                json.dump(partial_results, f, indent=2)
-            
-            # Calculate and show progress
-            processed = min(i + batch_size, total_words)
-            percent = (processed / total_words) * 100
-            elapsed = time.time() - start_time
-            remaining = (elapsed / processed) * (total_words - processed) if processed > 0 else 0
-            
-            print(f"Progress: {percent:.1f}% ({processed}/{total_words})")
-            print(f"Elapsed: {elapsed:.1f}s, Remaining: {remaining:.1f}s")
+        # Loop invariants, worked out once for the whole run
+        num_batches = (total_words + batch_size - 1) // batch_size
+        process = partial(self.process_word, language=language)
+        
+        batch_dir = self.output_dir / "batches"
+        os.makedirs(batch_dir, exist_ok=True)
+        
+        # Checkpoints are written by a background thread; the bounded queue keeps it at most a few batches behind
+        write_queue = queue.Queue(maxsize=4)
+        writer = threading.Thread(target=self.write_worker, args=(write_queue,), daemon=True)
+        writer.start()
+        
+        try:
+            # The words of a batch are fetched concurrently; statuses print in batch order
+            with ThreadPoolExecutor(max_workers=min(batch_size, self.max_workers)) as executor:
+                # tqdm redraws a single progress line and works out the elapsed/remaining times itself
+                batches = tqdm(range(0, total_words, batch_size), total=num_batches, desc="Batches", unit="batch")
+                for batch_index, i in enumerate(batches):
+                    batch = word_list[i:i+batch_size]
+                    
+                    batch_file = batch_dir / f"partial_batch_{batch_index}.json"
+                    
+                    # Recover the batch from an earlier run's checkpoint instead of processing it again
+                    checkpoint = self.load_checkpoint(batch_file, batch) if resume else None
+                    if checkpoint is not None:
+                        results.update(checkpoint)
+                        if verbose:
+                            tqdm.write(f"  Restored {len(checkpoint)} words from {batch_file.name}")
+                    else:
+                        partial_results = {}
+                        for word, result in zip(batch, executor.map(process, batch)):
+                            results[word] = result
+                            partial_results[word] = result
+                            
+                            # Print a short status
+                            if verbose:
+                                if result.get("roots"):
+                                    tqdm.write(f"  ✓ {word}: Found {len(result['roots'])} roots")
+                                else:
+                                    tqdm.write(f"  ✗ {word}: No roots found")
+                        
+                        # Save this batch's results to demonstrate recovery capability; a resumed
+                        # run restores them through load_checkpoint. Checkpoints are only read
+                        # back by code, so they are written unindented
+                        write_queue.put((batch_file, orjson.dumps(partial_results)))
+        finally:
+            # Let the writer finish the queued checkpoints, even when a batch fails or the run is interrupted
+            write_queue.put(None)
+            writer.join()
         
         return results
+    
+    def load_checkpoint(self, batch_file, batch):
+        """Return a batch's saved results if its checkpoint covers exactly these words, else None."""
+        try:
+            with open(batch_file, "rb") as f:
+                checkpoint = orjson.loads(f.read())
+        except (OSError, ValueError, TypeError):
+            # Missing, unreadable or corrupt (orjson.JSONDecodeError is a ValueError): process the batch afresh
+            return None
+        
+        # A stale or hand-edited file may hold something other than a word -> result mapping
+        if not isinstance(checkpoint, dict) or not all(isinstance(result, dict) for result in checkpoint.values()):
+            return None
+        return checkpoint if checkpoint.keys() == set(batch) else None
+    
+    def write_worker(self, write_queue):
+        """Write queued (path, payload) pairs until a None sentinel arrives."""
+        while True:
+            item = write_queue.get()
+            if item is None:
+                break
+            
+            path, payload = item
+            try:
+                # Write beside the checkpoint and swap it in, so a crash never leaves a half-written one
+                tmp_path = path.with_suffix(".json.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.error("Error writing %s: %s", path, e)
 
 def main():
     """Main function to test the etymology system."""
+    parser = argparse.ArgumentParser(description='Test the etymology system on a few sample words')
+    parser.add_argument('--quiet', action='store_true', help='Skip per-word batch status lines and the sample data dump')
+    parser.add_argument('--resume', action='store_true', help="Restore batches from an earlier run's checkpoints instead of processing them again")
+    args = parser.parse_args()
+    
     # Sample words to test
     test_words = [
         "etymology", 
@@ -734,7 +870,10 @@ def main():
     
     # Test batch processing with recovery
     print("\n=== Testing Batch Processing with Recovery ===")
-    tester.process_batch(test_words, batch_size=3)
+    tester.process_batch(test_words, batch_size=3, resume=args.resume, verbose=not args.quiet)
+    
+    # Nothing is fetched from here on
+    tester.close()
     
     # Print summary
     elapsed_time = time.time() - start_time
@@ -769,9 +908,10 @@ def main():
     print("\n=== Generated Data Structure Example ===")
     sample_word = "etymology"
     sample_data = results.get(sample_word)
-    if sample_data:
+    if sample_data and not args.quiet:
         print(f"Sample data structure for '{sample_word}':")
-        print(json.dumps(sample_data, indent=2))
+        # pformat needs no serialization and elides anything nested deeper than a root's fields
+        print(pprint.pformat(sample_data, depth=3, width=120))
     
     print("\nData is saved in 'test_output' directory for inspection")
 
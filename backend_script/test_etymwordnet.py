@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import os
 import sys
+import csv
 import json
 import logging
+from collections import defaultdict
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +17,22 @@ logging.basicConfig(
 logger = logging.getLogger("test_etymwordnet")
 
 class EtymWordnetTest:
+    # Etymological Wordnet language codes, and the reverse mapping for root entries
+    LANG_CODES = {
+        "English": "eng",
+        "French": "fra",
+        "Latin": "lat",
+        "Ancient Greek": "grc"
+    }
+    LANG_NAMES = {code: name for name, code in LANG_CODES.items()}
+    
+    # Estimated period of a root's language
+    ROOT_LANGUAGE_YEARS = {
+        "Latin": -100,  # Classical Latin period
+        "Ancient Greek": -400,  # Classical Greek period
+        "Proto-Indo-European": -4500  # Estimated PIE period
+    }
+    
     def __init__(self):
         self.test_words = {
             "English": ["etymology", "computer", "biology", "philosophy"],
@@ -87,38 +105,41 @@ class EtymWordnetTest:
             }
             
             # Write sample data to CSV
-            with open(sample_file, 'w', encoding='utf-8') as f:
-                f.write("lang,word,roots,year,definition\n")
-                for lang, words in sample_data.items():
-                    for word, data in words.items():
-                        roots = "|".join(data["roots"])
-                        year = data.get("year", "")
-                        definition = data.get("definition", "").replace(",", ";")
-                        f.write(f"{lang},{word},{roots},{year},{definition}\n")
+            # csv.writer quotes definitions that contain commas
+            rows = [
+                (lang, word, "|".join(data["roots"]), data.get("year", ""), data.get("definition", ""))
+                for lang, words in sample_data.items()
+                for word, data in words.items()
+            ]
+            with open(sample_file, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(["lang", "word", "roots", "year", "definition"])
+                writer.writerows(rows)
                         
         # Load sample data into memory
-        self.etymwordnet_data = {}
+        self.etymwordnet_data = defaultdict(dict)
         try:
-            with open(sample_file, 'r', encoding='utf-8') as f:
+            with open(sample_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
                 # Skip header
-                next(f)
-                for line in f:
+                next(reader)
+                for row in reader:
                     try:
-                        parts = line.strip().split(',', 4)
-                        if len(parts) >= 4:
-                            lang, word, roots, year = parts[0], parts[1], parts[2], parts[3]
-                            definition = parts[4] if len(parts) > 4 else ""
+                        if len(row) >= 4:
+                            lang, word, roots, year = row[0], row[1], row[2], row[3]
+                            # Files written before definitions were quoted split them on commas
+                            definition = ",".join(row[4:]).rstrip()
                             
-                            if lang not in self.etymwordnet_data:
-                                self.etymwordnet_data[lang] = {}
-                                
-                            self.etymwordnet_data[lang][word] = {
+                            self.etymwordnet_data[lang][word.lower()] = {
                                 "roots": roots.split("|") if roots else [],
                                 "year": int(year) if year and year.strip().lstrip('-').isdigit() else None,
                                 "definition": definition
                             }
                     except Exception as e:
-                        logger.error(f"Error parsing etymwordnet line: {line}, {str(e)}")
+                        logger.error(f"Error parsing etymwordnet line: {row}, {str(e)}")
+            
+            # Plain dict again so lookups of unknown languages don't insert entries
+            self.etymwordnet_data = dict(self.etymwordnet_data)
                         
             total_words = sum(len(words) for words in self.etymwordnet_data.values())
             logger.info(f"Loaded {total_words} words from Etymological Wordnet")
@@ -128,7 +149,7 @@ class EtymWordnetTest:
             
     def test_fetch_from_etymwordnet(self, word, language):
         """Test fetching from etymwordnet"""
-        logger.info(f"Testing etymwordnet source for {word} ({language})")
+        logger.info("Testing etymwordnet source for %s (%s)", word, language)
         
         result = {
             "word": word,
@@ -139,23 +160,20 @@ class EtymWordnetTest:
         }
         
         # Get language code
-        lang_codes = {
-            "English": "eng",
-            "French": "fra",
-            "Latin": "lat",
-            "Ancient Greek": "grc"
-        }
-        lang_code = lang_codes.get(language)
+        lang_code = self.LANG_CODES.get(language)
         
         if not lang_code:
-            logger.warning(f"Unknown language code for {language}")
+            logger.warning("Unknown language code for %s", language)
             return result
             
-        # Check if word exists in sample data
-        word_lower = word.lower()
-        if lang_code in self.etymwordnet_data and word_lower in self.etymwordnet_data[lang_code]:
-            word_data = self.etymwordnet_data[lang_code][word_lower]
-            logger.info(f"Found {word} in etymwordnet sample data")
+        # Check if word exists in sample data; keys are lower-cased at load,
+        # so lower-case input is found without calling lower()
+        lang_words = self.etymwordnet_data.get(lang_code, {})
+        word_data = lang_words.get(word)
+        if word_data is None:
+            word_data = lang_words.get(word.lower())
+        if word_data is not None:
+            logger.info("Found %s in etymwordnet sample data", word)
             
             # Add year and definition
             if word_data.get("year"):
@@ -169,25 +187,16 @@ class EtymWordnetTest:
                 # Parse the root format (e.g., "grc:ἐτυμολογία")
                 if ":" in root_entry:
                     root_lang_code, root_word = root_entry.split(":", 1)
-                    lang_names = {v: k for k, v in lang_codes.items()}
-                    target_lang = lang_names.get(root_lang_code, root_lang_code)
+                    target_lang = self.LANG_NAMES.get(root_lang_code, root_lang_code)
                     
                     root = {
                         "word": root_word,
                         "language": target_lang,
-                        "year": None
+                        "year": self.ROOT_LANGUAGE_YEARS.get(target_lang)  # Estimate year based on language
                     }
                     
-                    # Estimate year based on language
-                    if target_lang == "Latin":
-                        root["year"] = -100  # Classical Latin period
-                    elif target_lang == "Ancient Greek":
-                        root["year"] = -400  # Classical Greek period
-                    elif target_lang == "Proto-Indo-European":
-                        root["year"] = -4500  # Estimated PIE period
-                    
                     result["roots"].append(root)
-                    logger.info(f"Added root: {root_word} ({target_lang})")
+                    logger.info("Added root: %s (%s)", root_word, target_lang)
         
         return result
         
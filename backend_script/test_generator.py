@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
-import json
 import logging
 import os
 import time
 import random
-import statistics
-from pathlib import Path
-from etymology_generator import EtymologyGenerator
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
 
 # Configure logging
 logging.basicConfig(
@@ -21,134 +20,158 @@ logger = logging.getLogger("test_generator")
 
 # Sample words with known etymology for testing
 TEST_WORDS = {
-    "English": ["etymology", "computer", "philosophy", "democracy", "biology"],
-    "French": ["bonjour", "merci", "fromage", "château", "café"],
-    "Latin": ["veni", "vidi", "vici", "aqua", "terra"],
-    "Greek": ["logos", "cosmos", "pathos", "ethos", "chronos"]
+    "English": ("etymology", "biology", "computer", "philosophy", "democracy"),
+    "French": ("bonjour", "merci", "château", "fromage", "café"),
+    "Latin": ("veni", "vidi", "vici", "aqua", "terra"),
+    "Greek": ("logos", "cosmos", "pathos", "ethos", "chronos")
 }
 
-# Reference data for quality checks
+# Reference data for quality checks: read-only entries with tuple lists, so callers can share them without copying
 REFERENCE_ETYMOLOGIES = {
-    "etymology": {
+    "etymology": MappingProxyType({
         "language": "English",
         "year": 1398,
-        "expected_roots": ["etymologia", "etymon", "ετυμολογία", "etymologie"],
-        "expected_languages": ["Latin", "Greek", "Ancient Greek", "Old French"]
-    },
-    "philosophy": {
+        "expected_roots": ("etymologia", "etymon", "ετυμολογία", "etymologie"),
+        "expected_languages": ("Latin", "Greek", "Ancient Greek", "Old French")
+    }),
+    "philosophy": MappingProxyType({
         "language": "English",
         "year": 1300,
-        "expected_roots": ["philosophia", "philosophos", "φιλοσοφία", "philosophie"],
-        "expected_languages": ["Latin", "Greek", "Ancient Greek", "Old French"]
-    },
-    "democracy": {
+        "expected_roots": ("philosophia", "philosophos", "φιλοσοφία", "philosophie"),
+        "expected_languages": ("Latin", "Greek", "Ancient Greek", "Old French")
+    }),
+    "democracy": MappingProxyType({
         "language": "English",
         "year": 1570,
-        "expected_roots": ["democratia", "δημοκρατία", "demos", "kratos", "dēmocratia"],
-        "expected_languages": ["Latin", "Greek", "Ancient Greek", "Medieval Latin"]
-    },
-    "computer": {
+        "expected_roots": ("democratia", "δημοκρατία", "demos", "kratos", "dēmocratia"),
+        "expected_languages": ("Latin", "Greek", "Ancient Greek", "Medieval Latin")
+    }),
+    "computer": MappingProxyType({
         "language": "English",
         "year": 1640,
-        "expected_roots": ["compute", "computare", "computus"],
-        "expected_languages": ["English", "Latin", "Medieval Latin", "Middle English"]
-    },
-    "biology": {
+        "expected_roots": ("compute", "computare", "computus"),
+        "expected_languages": ("English", "Latin", "Medieval Latin", "Middle English")
+    }),
+    "biology": MappingProxyType({
         "language": "English",
         "year": 1819,
-        "expected_roots": ["bio", "logia", "bios", "logos", "βίος", "biologia"],
-        "expected_languages": ["Greek", "Ancient Greek", "New Latin", "Latin"]
-    },
-    "bonjour": {
+        "expected_roots": ("bio", "logia", "bios", "logos", "βίος", "biologia"),
+        "expected_languages": ("Greek", "Ancient Greek", "New Latin", "Latin")
+    }),
+    "bonjour": MappingProxyType({
         "language": "French",
         "year": 1400,
-        "expected_roots": ["bon", "jour", "diurnum", "jour", "diurnus"],
-        "expected_languages": ["Latin", "Old French", "French"]
-    },
-    "merci": {
+        "expected_roots": ("bon", "jour", "diurnum", "jour", "diurnus"),
+        "expected_languages": ("Latin", "Old French", "French")
+    }),
+    "merci": MappingProxyType({
         "language": "French",
         "year": 1200,
-        "expected_roots": ["mercedem", "merces", "mercit"],
-        "expected_languages": ["Latin", "Old French"]
-    },
-    "château": {
+        "expected_roots": ("mercedem", "merces", "mercit"),
+        "expected_languages": ("Latin", "Old French")
+    }),
+    "château": MappingProxyType({
         "language": "French",
         "year": 1100,
-        "expected_roots": ["castellum", "chastel", "castrum"],
-        "expected_languages": ["Latin", "Old French"]
-    },
-    "fromage": {
+        "expected_roots": ("castellum", "chastel", "castrum"),
+        "expected_languages": ("Latin", "Old French")
+    }),
+    "fromage": MappingProxyType({
         "language": "French",
         "year": 1200,
-        "expected_roots": ["formaticus", "forma"],
-        "expected_languages": ["Latin", "Vulgar Latin", "Late Latin"]
-    },
-    "café": {
+        "expected_roots": ("formaticus", "forma"),
+        "expected_languages": ("Latin", "Vulgar Latin", "Late Latin")
+    }),
+    "café": MappingProxyType({
         "language": "French",
         "year": 1690,
-        "expected_roots": ["kahve", "qahwah", "koffie"],
-        "expected_languages": ["Turkish", "Arabic", "Dutch"]
-    },
-    "logos": {
+        "expected_roots": ("kahve", "qahwah", "koffie"),
+        "expected_languages": ("Turkish", "Arabic", "Dutch")
+    }),
+    "logos": MappingProxyType({
         "language": "Greek",
         "year": -700,
-        "expected_roots": ["legein", "λόγος", "lego"],
-        "expected_languages": ["Proto-Indo-European", "Ancient Greek"]
-    },
-    "aqua": {
+        "expected_roots": ("legein", "λόγος", "lego"),
+        "expected_languages": ("Proto-Indo-European", "Ancient Greek")
+    }),
+    "aqua": MappingProxyType({
         "language": "Latin",
         "year": -100,
-        "expected_roots": ["akwa", "ap-"],
-        "expected_languages": ["Proto-Indo-European", "Proto-Italic"]
-    },
-    "veni": {
+        "expected_roots": ("akwa", "ap-"),
+        "expected_languages": ("Proto-Indo-European", "Proto-Italic")
+    }),
+    "veni": MappingProxyType({
         "language": "Latin",
         "year": -100,
-        "expected_roots": ["venire", "gwem"],
-        "expected_languages": ["Proto-Indo-European", "Proto-Italic"]
-    },
-    "terra": {
+        "expected_roots": ("venire", "gwem"),
+        "expected_languages": ("Proto-Indo-European", "Proto-Italic")
+    }),
+    "terra": MappingProxyType({
         "language": "Latin",
         "year": -100,
-        "expected_roots": ["ters", "tersus", "torrid"],
-        "expected_languages": ["Proto-Indo-European", "Proto-Italic"]
-    },
-    "vici": {
+        "expected_roots": ("ters", "tersus", "torrid"),
+        "expected_languages": ("Proto-Indo-European", "Proto-Italic")
+    }),
+    "vici": MappingProxyType({
         "language": "Latin",
         "year": -100,
-        "expected_roots": ["vincere", "vicis"],
-        "expected_languages": ["Proto-Indo-European", "Proto-Italic", "Latin"]
-    },
-    "vidi": {
+        "expected_roots": ("vincere", "vicis"),
+        "expected_languages": ("Proto-Indo-European", "Proto-Italic", "Latin")
+    }),
+    "vidi": MappingProxyType({
         "language": "Latin",
         "year": -100,
-        "expected_roots": ["videre", "weid", "vidēre"],
-        "expected_languages": ["Proto-Indo-European", "Proto-Italic", "Latin"]
-    },
-    "chronos": {
+        "expected_roots": ("videre", "weid", "vidēre"),
+        "expected_languages": ("Proto-Indo-European", "Proto-Italic", "Latin")
+    }),
+    "chronos": MappingProxyType({
         "language": "Greek",
         "year": -700,
-        "expected_roots": ["χρόνος", "khronos"],
-        "expected_languages": ["Ancient Greek", "Greek"]
-    },
-    "ethos": {
+        "expected_roots": ("χρόνος", "khronos"),
+        "expected_languages": ("Ancient Greek", "Greek")
+    }),
+    "ethos": MappingProxyType({
         "language": "Greek",
         "year": -700,
-        "expected_roots": ["ἦθος", "ethos"],
-        "expected_languages": ["Ancient Greek", "Greek"]
-    },
-    "pathos": {
+        "expected_roots": ("ἦθος", "ethos"),
+        "expected_languages": ("Ancient Greek", "Greek")
+    }),
+    "pathos": MappingProxyType({
         "language": "Greek",
         "year": -700,
-        "expected_roots": ["πάθος", "pathos"],
-        "expected_languages": ["Ancient Greek", "Greek"]
-    },
-    "cosmos": {
+        "expected_roots": ("πάθος", "pathos"),
+        "expected_languages": ("Ancient Greek", "Greek")
+    }),
+    "cosmos": MappingProxyType({
         "language": "Greek",
         "year": -700,
-        "expected_roots": ["κόσμος", "kosmos"],
-        "expected_languages": ["Ancient Greek", "Greek"]
-    }
+        "expected_roots": ("κόσμος", "kosmos"),
+        "expected_languages": ("Ancient Greek", "Greek")
+    })
+}
+
+# Root languages expected in each test output file, keyed like the file name (e.g. "English_etymology")
+EXPECTED_ROOT_LANGUAGES = {
+    "English_etymology": frozenset(["Latin", "Ancient Greek"]),
+    "English_biology": frozenset(["Greek", "Ancient Greek"]),
+    "English_computer": frozenset(["Latin"]),
+    "English_philosophy": frozenset(["Latin", "Ancient Greek", "Greek"]),
+    "English_democracy": frozenset(["Ancient Greek", "Greek"]),
+    "French_bonjour": frozenset(["French", "Latin"]),
+    "French_merci": frozenset(["Latin"]),
+    "French_château": frozenset(["Latin"]),
+    "French_fromage": frozenset(["Latin"]),
+    "French_café": frozenset(["Arabic"]),
+    "Latin_veni": frozenset(["Proto-Indo-European"]),
+    "Latin_vidi": frozenset(["Proto-Indo-European"]),
+    "Latin_vici": frozenset(["Proto-Indo-European"]),
+    "Latin_aqua": frozenset(["Proto-Indo-European"]),
+    "Latin_terra": frozenset(["Proto-Indo-European"]),
+    "Greek_logos": frozenset(["Ancient Greek", "Greek"]),
+    "Greek_cosmos": frozenset(["Ancient Greek", "Greek"]),
+    "Greek_pathos": frozenset(["Ancient Greek", "Greek"]),
+    "Greek_ethos": frozenset(["Ancient Greek", "Greek"]),
+    "Greek_chronos": frozenset(["Ancient Greek", "Greek"])
 }
 
 class EtymologyGeneratorTester:
@@ -160,82 +183,102 @@ class EtymologyGeneratorTester:
         self.successful_words = 0
         self.failed_words = 0
         self.connections = 0
-        self.quality_scores = []
+        # Running total of quality scores; only their mean is reported
+        self.quality_score_total = 0
+        self.quality_score_count = 0
         self.test_output_dir = "./test_output"
         
-        if not os.path.exists(self.test_output_dir):
-            os.makedirs(self.test_output_dir)
+        os.makedirs(self.test_output_dir, exist_ok=True)
     
-    def run_test(self, use_fixed_list=True):
+    def add_quality_score(self, score):
+        """Add a word's quality score to the running total"""
+        self.quality_score_total += score
+        self.quality_score_count += 1
+    
+    def run_test(self, use_fixed_list=True, threads=4):
         """Run test with optional fixed word list"""
         logger.info("Starting test run with fixed word lists")
         
+        # Imported here so analyze_quality and the module constants work without the generator's dependencies
+        from etymology_generator import EtymologyGenerator
+        
         # Create generator with test mode and geographical data enabled
         generator = EtymologyGenerator(
             max_words=5, 
             languages=["English", "French", "Latin", "Greek"],
             test_mode=True,
             sources="wiktionary,etymonline,etymwordnet,ielex,starling",
-            geo_data=True  # Enable geographical data collection
+            geo_data=True,  # Enable geographical data collection
+            threads=threads
         )
         
         # Set test output directory
         generator.output_dir = self.test_output_dir
         
-        start_time = time.time()
+        # Monotonic clock, so the elapsed time is unaffected by system clock adjustments
+        start_ns = time.perf_counter_ns()
         
         if use_fixed_list:
-            test_words = {
-                "English": ["etymology", "biology", "computer", "philosophy", "democracy"],
-                "French": ["bonjour", "merci", "château", "fromage", "café"],
-                "Latin": ["veni", "vidi", "vici", "aqua", "terra"],
-                "Greek": ["logos", "cosmos", "pathos", "ethos", "chronos"]
-            }
+            test_words = TEST_WORDS
             
-            # Process each test word
-            for language, words in test_words.items():
-                generator.logger.info(f"Processing {len(words)} {language} words")
-                for word in words:
+            # Process the test words concurrently, since each one mostly waits on network fetches;
+            # the generator locks its own counters and memo, and this tester's tallies are only
+            # updated here on the main thread as futures complete
+            with ThreadPoolExecutor(max_workers=generator.threads) as executor:
+                futures = {}
+                for language, words in test_words.items():
+                    generator.logger.info("Processing %d %s words", len(words), language)
+                    for word in words:
+                        futures[executor.submit(generator.process_word, word, language)] = word
+                
+                for future in as_completed(futures):
+                    word = futures[future]
                     try:
-                        result = generator.process_word(word, language)
+                        result = future.result()
                         self.words_processed += 1
                         if result:
                             self.successful_words += 1
                             self.connections += len(result.get("roots", []))
-                            self.quality_scores.append(result.get("quality_score", 0))
+                            self.add_quality_score(result.get("quality_score", 0))
                         else:
                             self.failed_words += 1
                     except Exception as e:
-                        generator.logger.error(f"Error processing {word}: {str(e)}")
+                        generator.logger.error("Error processing %s: %s", word, e)
                         self.failed_words += 1
+            
+            # Persist the generator's etymology memo so the next test run reuses these fetches
+            generator.save_state()
                     
-        end_time = time.time()
-        elapsed_minutes = (end_time - start_time) / 60
+        elapsed_minutes = (time.perf_counter_ns() - start_ns) / 60_000_000_000
         
         # Log results
-        generator.logger.info(f"Completed in {elapsed_minutes:.2f} minutes")
-        generator.logger.info(f"Total words processed: {self.words_processed}")
-        generator.logger.info(f"Successful words: {self.successful_words}")
-        generator.logger.info(f"Failed words: {self.failed_words}")
-        generator.logger.info(f"Total connections: {self.connections}")
+        generator.logger.info("\n".join([
+            f"Completed in {elapsed_minutes:.2f} minutes",
+            f"Total words processed: {self.words_processed}",
+            f"Successful words: {self.successful_words}",
+            f"Failed words: {self.failed_words}",
+            f"Total connections: {self.connections}"
+        ]))
         
         # Return generator statistics for analysis
-        return generator.stats if hasattr(generator, 'stats') else {}
+        return getattr(generator, 'stats', {})
         
     def analyze_quality(self):
         """Analyze the quality of generated etymology data"""
-        logger.info("Test run completed")
-        logger.info(f"Words processed: {self.words_processed}")
-        logger.info(f"Successful words: {self.successful_words}")
-        logger.info(f"Failed words: {self.failed_words}")
-        logger.info(f"Total connections: {self.connections}")
+        logger.info("\n".join([
+            "Test run completed",
+            f"Words processed: {self.words_processed}",
+            f"Successful words: {self.successful_words}",
+            f"Failed words: {self.failed_words}",
+            f"Total connections: {self.connections}"
+        ]))
         
-        if not self.quality_scores:
+        if not self.quality_score_count:
             logger.warning("No quality data available for analysis")
             return
             
         # Calculate metrics
-        avg_quality = statistics.mean(self.quality_scores) if self.quality_scores else 0
+        avg_quality = self.quality_score_total / self.quality_score_count
         
         # Check files for specific criteria
         words_with_roots = 0
@@ -245,67 +288,41 @@ class EtymologyGeneratorTester:
         words_with_definitions = 0
         invalid_roots = 0
         
-        # Expected roots for validation
-        expected_roots = {
-            "English_etymology": ["Latin", "Ancient Greek"],
-            "English_biology": ["Greek", "Ancient Greek"],
-            "English_computer": ["Latin"],
-            "English_philosophy": ["Latin", "Ancient Greek", "Greek"],
-            "English_democracy": ["Ancient Greek", "Greek"],
-            "French_bonjour": ["French", "Latin"],
-            "French_merci": ["Latin"],
-            "French_château": ["Latin"],
-            "French_fromage": ["Latin"],
-            "French_café": ["Arabic"],
-            "Latin_veni": ["Proto-Indo-European"],
-            "Latin_vidi": ["Proto-Indo-European"],
-            "Latin_vici": ["Proto-Indo-European"],
-            "Latin_aqua": ["Proto-Indo-European"],
-            "Latin_terra": ["Proto-Indo-European"],
-            "Greek_logos": ["Ancient Greek", "Greek"],
-            "Greek_cosmos": ["Ancient Greek", "Greek"],
-            "Greek_pathos": ["Ancient Greek", "Greek"],
-            "Greek_ethos": ["Ancient Greek", "Greek"],
-            "Greek_chronos": ["Ancient Greek", "Greek"]
-        }
+        # Check all output files; scandir entries carry their path and file type, so no join or stat per file
+        with os.scandir(self.test_output_dir) as entries:
+            json_files = [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
         
-        # Check all output files
-        for file_name in os.listdir(self.test_output_dir):
-            if not file_name.endswith('.json'):
-                continue
-                
-            file_path = os.path.join(self.test_output_dir, file_name)
+        # Bound once, since the loop looks up every file's expectations
+        expected_root_languages = EXPECTED_ROOT_LANGUAGES.get
+        
+        for entry in json_files:
+            file_name = entry.name
             
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(entry.path, 'rb') as f:
+                    data = orjson.loads(f.read())
                     
                 # File key is language_word (e.g., "English_etymology")
-                file_key = file_name.replace('.json', '')
+                file_key = file_name[:-len('.json')]
+                roots = data.get('roots')
+                definition = data.get('definition') or ''
                 
                 # Check for roots
-                if data.get('roots') and len(data['roots']) > 0:
+                if roots:
                     words_with_roots += 1
                     
-                    # Check for valid root languages
-                    root_languages = [root.get('language') for root in data.get('roots', [])]
-                    invalid_language = False
-                    
-                    for lang in root_languages:
-                        if not lang or lang in ["Unknown", "unknown"]:
-                            invalid_language = True
+                    # Collect root languages and count invalid ones in a single pass over the roots
+                    root_languages = set()
+                    for root in roots:
+                        lang = root.get('language')
+                        if not lang or lang in ("Unknown", "unknown"):
                             invalid_roots += 1
+                        root_languages.add(lang)
                             
                     # Check if expected roots are present
-                    expected = expected_roots.get(file_key, [])
+                    expected = expected_root_languages(file_key)
                     if expected:
-                        found_expected = False
-                        for expected_lang in expected:
-                            if any(expected_lang == lang for lang in root_languages):
-                                found_expected = True
-                                break
-                                
-                        if found_expected:
+                        if not expected.isdisjoint(root_languages):
                             words_with_expected_roots += 1
                     else:
                         # No expectations defined, consider it valid
@@ -316,16 +333,16 @@ class EtymologyGeneratorTester:
                     words_with_year += 1
                     
                 # Check for sensible definition
-                if data.get('definition') and len(data.get('definition', '')) > 10:
+                if len(definition) > 10:
                     words_with_definitions += 1
                     
                 # Check language
-                expected_lang = file_key.split('_')[0]
+                expected_lang = file_key.partition('_')[0]
                 if data.get('language') == expected_lang:
                     words_with_expected_languages += 1
                     
             except Exception as e:
-                logger.error(f"Error analyzing {file_name}: {str(e)}")
+                logger.error("Error analyzing %s: %s", file_name, e)
                 
         # Calculate percentages
         pct_roots = (words_with_roots / self.words_processed) * 100 if self.words_processed > 0 else 0
@@ -334,16 +351,20 @@ class EtymologyGeneratorTester:
         pct_expected_languages = (words_with_expected_languages / self.words_processed) * 100 if self.words_processed > 0 else 0
         pct_definitions = (words_with_definitions / self.words_processed) * 100 if self.words_processed > 0 else 0
         
-        # Print quality report
-        logger.info("\n===== DATA QUALITY REPORT =====")
-        logger.info(f"Average quality score: {avg_quality:.2f}/100")
-        logger.info(f"Words with roots: {words_with_roots} ({pct_roots:.1f}%)")
-        logger.info(f"Words with correct year: {words_with_year} ({pct_year:.1f}%)")
-        logger.info(f"Words with expected roots: {words_with_expected_roots} ({pct_expected_roots:.1f}%)")
-        logger.info(f"Words with expected languages: {words_with_expected_languages} ({pct_expected_languages:.1f}%)")
-        logger.info(f"Words with sensible definitions: {words_with_definitions} ({pct_definitions:.1f}%)")
-        logger.info(f"Invalid root words detected: {invalid_roots}")
-        logger.info("=============================\n")
+        # Print quality report as one record, so the handlers format and flush it once
+        logger.info("\n".join([
+            "",
+            "===== DATA QUALITY REPORT =====",
+            f"Average quality score: {avg_quality:.2f}/100",
+            f"Words with roots: {words_with_roots} ({pct_roots:.1f}%)",
+            f"Words with correct year: {words_with_year} ({pct_year:.1f}%)",
+            f"Words with expected roots: {words_with_expected_roots} ({pct_expected_roots:.1f}%)",
+            f"Words with expected languages: {words_with_expected_languages} ({pct_expected_languages:.1f}%)",
+            f"Words with sensible definitions: {words_with_definitions} ({pct_definitions:.1f}%)",
+            f"Invalid root words detected: {invalid_roots}",
+            "=============================",
+            ""
+        ]))
         
         # Overall quality rating
         if avg_quality >= 80:
@@ -357,118 +378,14 @@ class EtymologyGeneratorTester:
         else:
             rating = "VERY POOR"
             
-        logger.info(f"QUALITY RATING: {rating}")
+        logger.info("QUALITY RATING: %s", rating)
 
 def main():
     """Run the test on a predefined set of words."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler("test_generator.log"),
-            logging.StreamHandler()
-        ]
-    )
-    logger = logging.getLogger("test_generator")
-    
-    # Create test output directory if it doesn't exist
-    test_output_dir = Path("./test_output")
-    if not os.path.exists(test_output_dir):
-        os.makedirs(test_output_dir)
-    
-    logger.info("Starting test run with fixed word lists")
-    
-    # Test with specific lists of words from different languages
-    english_words = ["etymology", "biology", "computer", "philosophy", "democracy"]
-    french_words = ["bonjour", "merci", "château", "fromage", "café"]
-    latin_words = ["veni", "vidi", "vici", "aqua", "terra"]
-    greek_words = ["logos", "cosmos", "pathos", "ethos", "chronos"]
-    
-    # Create a generator with test=True to use test-specific settings
-    generator = EtymologyGenerator(
-        test_mode=True,
-        sources="wiktionary,etymonline,etymwordnet,ielex,starling",
-        geo_data=True
-    )
-    
-    # Override the output directory to use the test directory
-    generator.output_dir = test_output_dir
-    
-    # Create a tester instance
     tester = EtymologyGeneratorTester()
-    tester.test_output_dir = test_output_dir
-    
-    # Process test words
-    start_time = time.time()
-    successful_words = 0
-    failed_words = 0
-    total_connections = 0
-    
-    logger.info(f"Processing {len(english_words)} English words")
-    for word in english_words:
-        result = generator.process_word(word, "English")
-        if result:
-            successful_words += 1
-            total_connections += len(result.get("roots", []))
-            tester.words_processed += 1
-            tester.successful_words += 1
-            tester.connections += len(result.get("roots", []))
-            tester.quality_scores.append(result.get("quality_score", 0))
-        else:
-            failed_words += 1
-            tester.failed_words += 1
-        
-    logger.info(f"Processing {len(french_words)} French words")
-    for word in french_words:
-        result = generator.process_word(word, "French")
-        if result:
-            successful_words += 1
-            total_connections += len(result.get("roots", []))
-            tester.words_processed += 1
-            tester.successful_words += 1
-            tester.connections += len(result.get("roots", []))
-            tester.quality_scores.append(result.get("quality_score", 0))
-        else:
-            failed_words += 1
-            tester.failed_words += 1
-    
-    logger.info(f"Processing {len(latin_words)} Latin words")
-    for word in latin_words:
-        result = generator.process_word(word, "Latin")
-        if result:
-            successful_words += 1
-            total_connections += len(result.get("roots", []))
-            tester.words_processed += 1
-            tester.successful_words += 1
-            tester.connections += len(result.get("roots", []))
-            tester.quality_scores.append(result.get("quality_score", 0))
-        else:
-            failed_words += 1
-            tester.failed_words += 1
-    
-    logger.info(f"Processing {len(greek_words)} Greek words")
-    for word in greek_words:
-        result = generator.process_word(word, "Greek")
-        if result:
-            successful_words += 1
-            total_connections += len(result.get("roots", []))
-            tester.words_processed += 1
-            tester.successful_words += 1
-            tester.connections += len(result.get("roots", []))
-            tester.quality_scores.append(result.get("quality_score", 0))
-        else:
-            failed_words += 1
-            tester.failed_words += 1
-    
-    # Report results
-    logger.info(f"Completed in {round((time.time() - start_time) / 60, 2)} minutes")
-    logger.info(f"Total words processed: {len(english_words + french_words + latin_words + greek_words)}")
-    logger.info(f"Successful words: {successful_words}")
-    logger.info(f"Failed words: {failed_words}")
-    logger.info(f"Total connections: {total_connections}")
-    logger.info("Test run completed")
     
-    # Analyze quality of the generated data
+    # Process the fixed word lists, then analyze quality of the generated data
+    tester.run_test()
     tester.analyze_quality()
 
 if __name__ == "__main__":